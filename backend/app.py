@@ -1,11 +1,39 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .routes.extraction import router as extraction_router
 from .routes.mapping import router as mapping_router
-from .routes.verification import router as verification_router
-from .routes.mosip import router as mosip_router
+from .routes.verification import router as verification_router, run_log_writer
+from .routes.mosip import router as mosip_router, mosip_client
+from .core import ocr_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Upload spooling and log writes are offloaded with asyncio.to_thread; cap the pool they share
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)))
+    # One keep-alive connection pool for every MOSIP call
+    app.state.mosip_http = mosip_client.open_http()
+    log_writer = asyncio.create_task(run_log_writer())
+    yield
+    log_writer.cancel()
+    await asyncio.gather(log_writer, return_exceptions=True)
+    await mosip_client.aclose()
+    ocr_pool.shutdown()
 
-app = FastAPI(title="MOSIP OCR Field Extraction API", version="1.0.0")
+
+app = FastAPI(
+    title="MOSIP OCR Field Extraction API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +63,7 @@ def home():
             "A2 - Field Mapping (YOU)": {
                 "extract_fields": "POST /api/v1/extract-fields",
                 "map_and_verify": "POST /api/v1/map-and-verify",
+                "map_and_verify_batch": "POST /api/v1/map-and-verify/batch",
                 "health": "GET /api/v1/health",
             },
             "A3 - Verification": {
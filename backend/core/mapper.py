@@ -1,14 +1,53 @@
 import re
 from typing import Dict, List, Optional
 try:
-    from rapidfuzz import fuzz  # type: ignore
+    from rapidfuzz import fuzz, process as fuzz_process  # type: ignore
     _HAS_RAPIDFUZZ = True
 except Exception:
     _HAS_RAPIDFUZZ = False
 
+# Regexes used on every extract_fields call are compiled once at import
+_LABEL_STARTS = re.compile(
+    r"^\s*(first\s*name|middle\s*name|last\s*name|surname|family\s*name|"
+    r"gender|sex|address|addr|city|state|age|dob|date\s*of\s*birth|phone|mobile|email|e-?mail)\b",
+    re.IGNORECASE,
+)
+_NAME_LINE = re.compile(r"^\s*name\s*[:\-]?\s*(.+)$", re.IGNORECASE)
+_VALUE_SEP = re.compile(r":|-")
+
+# Canonical label targets for the generic label-value fallback
+_FALLBACK_TARGETS = {
+    'name': ['name', 'full name', 'given name'],
+    'first_name': ['first name', 'firstname'],
+    'middle_name': ['middle name', 'middlename'],
+    'last_name': ['last name', 'lastname', 'surname'],
+    'address': ['address', 'addr'],
+    'city': ['city'],
+    'state': ['state'],
+    'pincode': ['pincode', 'pin code', 'pin', 'zipcode', 'zip code', 'zip'],
+    'phone': ['phone', 'phone number', 'mobile'],
+    'email': ['email', 'email id', 'e-mail'],
+    'gender': ['gender', 'sex'],
+    'dob': ['date of birth', 'dob', 'birth date'],
+    'age': ['age', 'years'],
+}
+_FALLBACK_PATTERNS = [
+    (canon, [re.compile(rf"^\s*{re.escape(lab)}\s*[:\-]?\s*(.+)$", re.IGNORECASE) for lab in labs])
+    for canon, labs in _FALLBACK_TARGETS.items()
+]
+
+_PHONE_JUNK = re.compile(r'[\s().-]')
+_WHITESPACE = re.compile(r'\s+')
+_QMAIL = re.compile(r'qmail')
+_NON_DIGIT = re.compile(r'\D')
+
+
 class FieldMapper:
     def __init__(self):
-        self.field_patterns = self._get_combined_patterns()
+        self.field_patterns = {
+            field: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for field, patterns in self._get_combined_patterns().items()
+        }
     
     def _get_combined_patterns(self):
         """Return patterns that include both Hindi and English"""
@@ -140,23 +179,17 @@ class FieldMapper:
                 "given name", "surname", "family name"
             ]
 
-            # Generic label starter detection to avoid taking the next label as value
-            LABEL_STARTS = re.compile(
-                r"^\s*(first\s*name|middle\s*name|last\s*name|surname|family\s*name|"
-                r"gender|sex|address|addr|city|state|age|dob|date\s*of\s*birth|phone|mobile|email|e-?mail)\b",
-                re.IGNORECASE,
-            )
-
             def score_label(text: str) -> str:
                 t = text.lower()
+                if _HAS_RAPIDFUZZ:
+                    # Cutoff lets rapidfuzz skip hopeless labels early; ties keep the first label
+                    hit = fuzz_process.extractOne(t, name_labels, scorer=fuzz.token_set_ratio, score_cutoff=80)
+                    return hit[0] if hit else ""
+                import difflib
                 best = None
                 best_s = 0
                 for lab in name_labels:
-                    if _HAS_RAPIDFUZZ:
-                        s = fuzz.token_set_ratio(lab, t)
-                    else:
-                        import difflib
-                        s = int(difflib.SequenceMatcher(None, lab, t).ratio() * 100)
+                    s = int(difflib.SequenceMatcher(None, lab, t).ratio() * 100)
                     if s > best_s:
                         best_s = s
                         best = lab
@@ -164,7 +197,7 @@ class FieldMapper:
 
             # Direct 'Name:' capture (single-label form)
             for ln in lines:
-                m_name = re.match(r"^\s*name\s*[:\-]?\s*(.+)$", ln, flags=re.IGNORECASE)
+                m_name = _NAME_LINE.match(ln)
                 if m_name:
                     full = m_name.group(1).strip()
                     if full:
@@ -178,13 +211,13 @@ class FieldMapper:
                 if label:
                     # Extract inline value after ':' or '-' else take next line
                     val = ""
-                    m = re.search(r":|-", ln)
+                    m = _VALUE_SEP.search(ln)
                     if m:
                         val = ln[m.end():].strip()
                     if not val and (i + 1) < len(lines):
                         nxt = lines[i + 1].strip()
                         # Avoid picking another label line (for any field)
-                        if not LABEL_STARTS.match(nxt):
+                        if not _LABEL_STARTS.match(nxt):
                             val = nxt
                             i += 1
 
@@ -201,7 +234,7 @@ class FieldMapper:
             if not name_parts:
                 for field in ['first_name', 'middle_name', 'last_name']:
                     for pattern in self.field_patterns.get(field, []):
-                        m = re.search(pattern, raw_text, re.IGNORECASE)
+                        m = pattern.search(raw_text)
                         if m:
                             name_parts[field] = self.clean_field(field, m.group(1).strip())
                             break
@@ -218,7 +251,7 @@ class FieldMapper:
 
         for field, patterns in self.field_patterns.items():
             for pattern in patterns:
-                match = re.search(pattern, raw_text, re.IGNORECASE)
+                match = pattern.search(raw_text)
                 if match:
                     raw_value = match.group(1).strip()
                     cleaned_value = self.clean_field(field, raw_value)
@@ -235,27 +268,11 @@ class FieldMapper:
             out: Dict[str, str] = {}
             name_parts_fb: Dict[str, str] = {}
             lines = [ln.strip() for ln in text.splitlines() if ln and len(ln.strip()) >= 3]
-            # Canonical label targets
-            targets = {
-                'name': ['name', 'full name', 'given name'],
-                'first_name': ['first name', 'firstname'],
-                'middle_name': ['middle name', 'middlename'],
-                'last_name': ['last name', 'lastname', 'surname'],
-                'address': ['address', 'addr'],
-                'city': ['city'],
-                'state': ['state'],
-                'pincode': ['pincode', 'pin code', 'pin', 'zipcode', 'zip code', 'zip'],
-                'phone': ['phone', 'phone number', 'mobile'],
-                'email': ['email', 'email id', 'e-mail'],
-                'gender': ['gender', 'sex'],
-                'dob': ['date of birth', 'dob', 'birth date'],
-                'age': ['age', 'years'],
-            }
             # Parse each line by flexible pattern: label [:|-] value OR exact startswith
             for ln in lines:
-                for canon, labs in targets.items():
-                    for lab in labs:
-                        m = re.match(rf"^\s*{re.escape(lab)}\s*[:\-]?\s*(.+)$", ln, flags=re.IGNORECASE)
+                for canon, label_patterns in _FALLBACK_PATTERNS:
+                    for label_pattern in label_patterns:
+                        m = label_pattern.match(ln)
                         if m:
                             val = m.group(1).strip()
                             if val:
@@ -320,16 +337,16 @@ class FieldMapper:
         raw_value = raw_value.strip()
         
         if field_name == 'phone':
-            return re.sub(r'[\s().-]', '', raw_value)
+            return _PHONE_JUNK.sub('', raw_value)
         
         elif field_name == 'email':
             cleaned = raw_value.lower()
-            cleaned = re.sub(r'\s+', '', cleaned)
-            cleaned = re.sub(r'qmail', 'gmail', cleaned)
+            cleaned = _WHITESPACE.sub('', cleaned)
+            cleaned = _QMAIL.sub('gmail', cleaned)
             return cleaned
         
         elif field_name == 'pincode':
-            digits = re.sub(r'\D', '', raw_value)
+            digits = _NON_DIGIT.sub('', raw_value)
             return digits[:6] if digits else raw_value
         
         elif field_name in ['first_name', 'middle_name', 'last_name']:
@@ -4,20 +4,46 @@ This stub avoids external network calls and returns predictable
 structures so the MOSIP routes can operate without real MOSIP
 credentials. Replace implementations with real MOSIP API calls
 when available.
+
+Methods are coroutines so real implementations can await the shared
+``httpx.AsyncClient`` on ``self.http`` (opened once per app lifespan via
+:meth:`MOSIPClient.open_http`) and reuse its keep-alive connections.
 """
 from __future__ import annotations
 
-import os
 import uuid
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, List
+
+import httpx
+
+# Shared across all MOSIP calls in the process
+MOSIP_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+MOSIP_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
 
 class MOSIPClient:
-    def __init__(self, base_url: str, auth_token: str | None = None):
+    def __init__(self, base_url: str, auth_token: str | None = None, http: httpx.AsyncClient | None = None):
         self.base_url = base_url.rstrip("/")
         self.auth_token = auth_token or ""
+        self.http = http
 
-    def create_pre_registration(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def open_http(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client this instance sends requests through."""
+        headers = {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else {}
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            limits=MOSIP_HTTP_LIMITS,
+            timeout=MOSIP_HTTP_TIMEOUT,
+        )
+        return self.http
+
+    async def aclose(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+
+    async def create_pre_registration(self, data: Dict[str, Any]) -> Dict[str, Any]:
         pre_reg_id = f"PRE{uuid.uuid4().hex[:10].upper()}"
         return {
             "status": "success",
@@ -26,13 +52,29 @@ class MOSIPClient:
             "base_url": self.base_url,
         }
 
-    def upload_document(self, pre_reg_id: str, file_path: str) -> Dict[str, Any]:
+    async def create_pre_registration_batch(self, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create one pre-registration per payload in a single round trip.
+
+        ``response`` holds one entry per payload, in request order.
+        """
+        return {
+            "status": "success",
+            "response": [
+                {"preRegistrationId": f"PRE{uuid.uuid4().hex[:10].upper()}"} for _ in payloads
+            ],
+            "base_url": self.base_url,
+        }
+
+    async def upload_document(self, pre_reg_id: str, document: BinaryIO, filename: str) -> Dict[str, Any]:
+        """Upload an open binary file; it is streamed from its start, not read into memory."""
+        # Rewind so a retried call sends the whole document again
+        document.seek(0)
         return {
             "status": "uploaded",
             "preRegistrationId": pre_reg_id,
-            "file": os.path.basename(file_path),
+            "file": filename,
         }
 
-    def get_application_status(self, pre_reg_id: str) -> str:
+    async def get_application_status(self, pre_reg_id: str) -> str:
         # Placeholder status; replace with real MOSIP lookup
         return "pending"
@@ -1,5 +1,6 @@
 from typing import Union, Optional, List
 import os
+import threading
 import numpy as np
 import cv2 as cv
 import re
@@ -13,28 +14,37 @@ except Exception:
 
 # Cache OCR instances per language to avoid re-initialization overhead
 _OCR_CACHE: dict[str, PaddleOCR] = {}
+_OCR_CACHE_LOCK = threading.Lock()
 
 
 def get_ocr(lang: str = "en") -> PaddleOCR:
-    """Return cached PaddleOCR instance with working flags for predict-only flow."""
-    if lang not in _OCR_CACHE:
-        # Prefer newer textline orientation and avoid passing both flags together
-        try:
-            _OCR_CACHE[lang] = PaddleOCR(
-                lang=lang,
-                use_doc_orientation_classify=False,
-                use_doc_unwarping=False,
-                use_textline_orientation=True,
-            )
-        except TypeError:
-            # Older versions: fall back to angle classifier
-            _OCR_CACHE[lang] = PaddleOCR(
-                lang=lang,
-                use_doc_orientation_classify=False,
-                use_doc_unwarping=False,
-                use_angle_cls=True,
-            )
-    return _OCR_CACHE[lang]
+    """Return cached PaddleOCR instance with working flags for predict-only flow.
+
+    Each model is built at most once per process; concurrent first callers
+    wait for the same instance instead of each paying the load cost.
+    """
+    ocr = _OCR_CACHE.get(lang)
+    if ocr is not None:
+        return ocr
+    with _OCR_CACHE_LOCK:
+        if lang not in _OCR_CACHE:
+            # Prefer newer textline orientation and avoid passing both flags together
+            try:
+                _OCR_CACHE[lang] = PaddleOCR(
+                    lang=lang,
+                    use_doc_orientation_classify=False,
+                    use_doc_unwarping=False,
+                    use_textline_orientation=True,
+                )
+            except TypeError:
+                # Older versions: fall back to angle classifier
+                _OCR_CACHE[lang] = PaddleOCR(
+                    lang=lang,
+                    use_doc_orientation_classify=False,
+                    use_doc_unwarping=False,
+                    use_angle_cls=True,
+                )
+        return _OCR_CACHE[lang]
 
 
 def preprocess(IMG: Union[str, np.ndarray]) -> np.ndarray:
@@ -90,6 +100,139 @@ def preprocess(IMG: Union[str, np.ndarray]) -> np.ndarray:
     return bgr
 
 
+# Normalize common field labels/values and remove basic noise
+def _normalize_text_lines(lines: List[str]) -> List[str]:
+    # Pre-normalize punctuation
+    def norm_punct(s: str) -> str:
+        return s.replace('—', '-').replace('–', '-').replace('：', ':')
+
+    # Identify lines that start new labels (after rough normalization)
+    LABEL_STARTS = re.compile(
+        r"^\s*(first\s*name|middle\s*name|last\s*name|surname|family\s*name|gender|sex|address|age)\b",
+        re.IGNORECASE,
+    )
+
+    # Phrase-level fuzzy label detection (very tolerant to misspellings)
+    PHRASES = {
+        "First Name": ["first name", "given name", "forename"],
+        "Middle Name": ["middle name"],
+        "Last Name": ["last name", "surname", "family name"],
+        "Gender": ["gender", "sex"],
+        "Address": ["address", "residential address", "permanent address", "current address", "correspondence address"],
+        "Age": ["age"],
+    }
+    PHRASE_LIST = [(canon, p) for canon, lst in PHRASES.items() for p in lst]
+    PHRASE_TEXTS = [p for _, p in PHRASE_LIST]
+
+    def best_label(line: str):
+        text = line.lower()
+        if _HAS_RAPIDFUZZ:
+            # One C-level scan over all phrases; ties keep the first phrase, as the loop did
+            hit = fuzz_process.extractOne(text, PHRASE_TEXTS, scorer=fuzz.token_set_ratio)
+            if hit is None or hit[1] <= 0:
+                return (None, None, 0.0)
+            canon, phrase = PHRASE_LIST[hit[2]]
+            return (canon, phrase, hit[1])
+        import difflib
+        best = (None, None, 0.0)
+        for canon, phrase in PHRASE_LIST:
+            score = difflib.SequenceMatcher(None, phrase, text).ratio() * 100
+            if score > best[2]:
+                best = (canon, phrase, score)
+        return best
+
+    out: List[str] = []
+    seen = set()
+    i = 0
+    N = len(lines)
+
+    def add(label: str, value: str) -> None:
+        v = value.strip().strip('-:').strip()
+        if not v:
+            return
+        norm = f"{label}: {v}"
+        if norm not in seen:
+            out.append(norm)
+            seen.add(norm)
+
+    while i < N:
+        raw0 = lines[i]
+        if not isinstance(raw0, str):
+            i += 1; continue
+        raw = raw0.strip()
+        if not raw:
+            i += 1; continue
+        ln = norm_punct(raw)
+        ln_low = ln.lower()
+
+        # 1) Fuzzy phrase detection first
+        canon, phrase, score = best_label(ln_low)
+        if canon and score >= 85:
+            # Extract inline value
+            val = ""
+            msep = re.search(r":|-", ln)
+            if msep:
+                val = ln[msep.end():].strip()
+            else:
+                if ln_low.startswith(phrase):
+                    val = ln[len(ln) - len(ln_low) + len(phrase):].strip()
+            # Fallback to next line if empty and next not a label
+            if not val and (i + 1) < N:
+                nxt_raw = (lines[i + 1] or "").strip()
+                nxt_ln = norm_punct(nxt_raw)
+                nxt_low = nxt_ln.lower()
+                if nxt_low and not LABEL_STARTS.match(nxt_low):
+                    val = nxt_raw
+                    i += 1
+
+            if canon == "Gender" and val:
+                vlow = val.lower()
+                if vlow in {"m", "male"}: val = "Male"
+                elif vlow in {"f", "female"}: val = "Female"
+            if canon == "Age" and val:
+                d = re.search(r"\b(\d{1,3})\b", val)
+                if d: val = d.group(1)
+
+            if val:
+                add(canon, val)
+                i += 1
+                continue
+
+        # 2) Regex fallback for inline patterns
+        m = re.match(r"^\s*(first\s*name|given\s*name|forename)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            add("First Name", ln[m.start(2):].strip()); i += 1; continue
+        m = re.match(r"^\s*(middle\s*name)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            add("Middle Name", ln[m.start(2):].strip()); i += 1; continue
+        m = re.match(r"^\s*(last\s*name|surname|family\s*name)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            add("Last Name", ln[m.start(2):].strip()); i += 1; continue
+
+        m = re.match(r"^\s*(gender|sex)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            val = ln[m.start(2):].strip(); vlow = val.lower()
+            if vlow in {"m", "male"}: val = "Male"
+            elif vlow in {"f", "female"}: val = "Female"
+            add("Gender", val); i += 1; continue
+
+        m = re.match(r"^\s*(address|addr|residential\s*address|permanent\s*address|current\s*address|correspondence\s*address)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            add("Address", ln[m.start(2):].strip()); i += 1; continue
+
+        m = re.match(r"^\s*(age)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
+        if m:
+            after = ln[m.start(2):]; d = re.search(r"\b(\d{1,3})\b", after)
+            if d: add("Age", d.group(1)); i += 1; continue
+
+        # 3) Keep other meaningful lines
+        if re.search(r"[A-Za-z0-9]", raw) and len(raw) >= 3 and raw not in seen:
+            out.append(raw); seen.add(raw)
+        i += 1
+
+    return out
+
+
 def _predict_texts(img_bgr: np.ndarray, lang: str = "en") -> str:
     """Use PaddleOCR.ocr (stable API) and extract recognized texts into a single string.
 
@@ -151,133 +294,6 @@ def _predict_texts(img_bgr: np.ndarray, lang: str = "en") -> str:
                 except Exception:
                     continue
 
-    # Normalize common field labels/values and remove basic noise
-    def _normalize_text_lines(lines: List[str]) -> List[str]:
-        # Pre-normalize punctuation
-        def norm_punct(s: str) -> str:
-            return s.replace('—', '-').replace('–', '-').replace('：', ':')
-
-        # Identify lines that start new labels (after rough normalization)
-        LABEL_STARTS = re.compile(
-            r"^\s*(first\s*name|middle\s*name|last\s*name|surname|family\s*name|gender|sex|address|age)\b",
-            re.IGNORECASE,
-        )
-
-        # Phrase-level fuzzy label detection (very tolerant to misspellings)
-        PHRASES = {
-            "First Name": ["first name", "given name", "forename"],
-            "Middle Name": ["middle name"],
-            "Last Name": ["last name", "surname", "family name"],
-            "Gender": ["gender", "sex"],
-            "Address": ["address", "residential address", "permanent address", "current address", "correspondence address"],
-            "Age": ["age"],
-        }
-        PHRASE_LIST = [(canon, p) for canon, lst in PHRASES.items() for p in lst]
-
-        def best_label(line: str):
-            text = line.lower()
-            best = (None, None, 0.0)
-            for canon, phrase in PHRASE_LIST:
-                if _HAS_RAPIDFUZZ:
-                    score = fuzz.token_set_ratio(phrase, text)
-                else:
-                    import difflib
-                    score = difflib.SequenceMatcher(None, phrase, text).ratio() * 100
-                if score > best[2]:
-                    best = (canon, phrase, score)
-            return best
-
-        out: List[str] = []
-        seen = set()
-        i = 0
-        N = len(lines)
-
-        def add(label: str, value: str) -> None:
-            v = value.strip().strip('-:').strip()
-            if not v:
-                return
-            norm = f"{label}: {v}"
-            if norm not in seen:
-                out.append(norm)
-                seen.add(norm)
-
-        while i < N:
-            raw0 = lines[i]
-            if not isinstance(raw0, str):
-                i += 1; continue
-            raw = raw0.strip()
-            if not raw:
-                i += 1; continue
-            ln = norm_punct(raw)
-            ln_low = ln.lower()
-
-            # 1) Fuzzy phrase detection first
-            canon, phrase, score = best_label(ln_low)
-            if canon and score >= 85:
-                # Extract inline value
-                val = ""
-                msep = re.search(r":|-", ln)
-                if msep:
-                    val = ln[msep.end():].strip()
-                else:
-                    if ln_low.startswith(phrase):
-                        val = ln[len(ln) - len(ln_low) + len(phrase):].strip()
-                # Fallback to next line if empty and next not a label
-                if not val and (i + 1) < N:
-                    nxt_raw = (lines[i + 1] or "").strip()
-                    nxt_ln = norm_punct(nxt_raw)
-                    nxt_low = nxt_ln.lower()
-                    if nxt_low and not LABEL_STARTS.match(nxt_low):
-                        val = nxt_raw
-                        i += 1
-
-                if canon == "Gender" and val:
-                    vlow = val.lower()
-                    if vlow in {"m", "male"}: val = "Male"
-                    elif vlow in {"f", "female"}: val = "Female"
-                if canon == "Age" and val:
-                    d = re.search(r"\b(\d{1,3})\b", val)
-                    if d: val = d.group(1)
-
-                if val:
-                    add(canon, val)
-                    i += 1
-                    continue
-
-            # 2) Regex fallback for inline patterns
-            m = re.match(r"^\s*(first\s*name|given\s*name|forename)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                add("First Name", ln[m.start(2):].strip()); i += 1; continue
-            m = re.match(r"^\s*(middle\s*name)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                add("Middle Name", ln[m.start(2):].strip()); i += 1; continue
-            m = re.match(r"^\s*(last\s*name|surname|family\s*name)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                add("Last Name", ln[m.start(2):].strip()); i += 1; continue
-
-            m = re.match(r"^\s*(gender|sex)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                val = ln[m.start(2):].strip(); vlow = val.lower()
-                if vlow in {"m", "male"}: val = "Male"
-                elif vlow in {"f", "female"}: val = "Female"
-                add("Gender", val); i += 1; continue
-
-            m = re.match(r"^\s*(address|addr|residential\s*address|permanent\s*address|current\s*address|correspondence\s*address)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                add("Address", ln[m.start(2):].strip()); i += 1; continue
-
-            m = re.match(r"^\s*(age)\s*[:\-]?\s*(.+)$", ln_low, flags=re.IGNORECASE)
-            if m:
-                after = ln[m.start(2):]; d = re.search(r"\b(\d{1,3})\b", after)
-                if d: add("Age", d.group(1)); i += 1; continue
-
-            # 3) Keep other meaningful lines
-            if re.search(r"[A-Za-z0-9]", raw) and len(raw) >= 3 and raw not in seen:
-                out.append(raw); seen.add(raw)
-            i += 1
-
-        return out
-
     texts = _normalize_text_lines(texts)
     return "\n".join(texts)
 
@@ -289,9 +305,18 @@ def image_bytes_to_bgr(data: bytes) -> Optional[np.ndarray]:
     return img if img is not None else None
 
 
-def extract_from_pdf_bytes(data: bytes, lang: str = "en", zoom: float = 6.0) -> str:
+# Pages whose embedded text layer has at least this many characters skip OCR
+PDF_TEXT_MIN_CHARS = 200
+
+
+def extract_from_pdf_bytes(data: bytes, lang: str = "en", zoom: float = 6.0,
+                           min_text_chars: int = PDF_TEXT_MIN_CHARS) -> str:
     """Rasterize PDF bytes with PyMuPDF and run _predict_texts per page.
 
+    Digital (text-native) pages are read straight from their text layer when
+    it holds at least ``min_text_chars`` characters; only image pages pay for
+    rasterization and OCR.
+
     Dynamically caps the rendered page size to ~3800px on the longest side
     to avoid Paddle's internal resize and preserve effective resolution.
     """
@@ -299,6 +324,12 @@ def extract_from_pdf_bytes(data: bytes, lang: str = "en", zoom: float = 6.0) ->
     all_text: list[str] = []
     try:
         for i, page in enumerate(doc, 1):
+            layer = page.get_text()
+            if len(layer.strip()) >= min_text_chars:
+                page_text = "\n".join(_normalize_text_lines([ln.strip() for ln in layer.splitlines()]))
+                all_text.append(f"--- PAGE {i} ---\n{page_text}")
+                continue
+
             # Compute a zoom per-page to cap longest side ~3800px
             MAX_SIDE = 3800.0
             page_w, page_h = float(page.rect.width), float(page.rect.height)
@@ -326,21 +357,38 @@ def extract_from_pdf_bytes(data: bytes, lang: str = "en", zoom: float = 6.0) ->
     return "\n\n".join(all_text)
 
 
-def process_input(inp: Union[str, bytes], lang: str = "en") -> str:
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp")
+
+
+def process_input(inp: Union[str, bytes], lang: str = "en", suffix: Optional[str] = None) -> str:
     """
     Public function used by routes:
-    - bytes: try image decode; if fails, assume PDF
-    - str path: branch by extension
+    - bytes: branch by ``suffix`` when given; otherwise try image decode
+      and, if that fails, assume PDF
+    - str path: branch by extension (or by ``suffix`` for extensionless
+      paths such as anonymous temp files); with neither, the content is
+      detected exactly as for bytes, so large spooled uploads and small
+      in-memory ones are treated alike
     Returns extracted text (may be empty string).
     """
     if isinstance(inp, bytes):
+        ext = (suffix or "").lower()
+        if ext == ".pdf":
+            return extract_from_pdf_bytes(inp, lang=lang)
+        if ext and ext not in IMAGE_EXTS:
+            raise ValueError("Unsupported file type: " + ext)
         img_bgr = image_bytes_to_bgr(inp)
         if img_bgr is not None:
             return _predict_texts(img_bgr, lang=lang)
+        if ext:
+            raise ValueError("Cannot decode image upload")
         return extract_from_pdf_bytes(inp, lang=lang)
 
-    ext = os.path.splitext(inp)[1].lower()
-    if ext in [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"]:
+    ext = (suffix or os.path.splitext(inp)[1]).lower()
+    if not ext:
+        with open(inp, "rb") as f:
+            return process_input(f.read(), lang=lang)
+    if ext in IMAGE_EXTS:
         # preprocess inside _predict_texts if path -> read here to ndarray for consistency
         img = cv.imread(inp)
         if img is None:
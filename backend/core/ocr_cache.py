@@ -0,0 +1,86 @@
+"""On-disk cache of OCR output keyed by document content hash.
+
+Identical resubmissions of a document skip OCR entirely. Entries are small
+JSON files under ``OCR_CACHE_DIR``; once more than ``OCR_CACHE_MAX_ENTRIES``
+exist the least recently written ones are evicted.
+
+Entries hold identity-document text, so the directory is created private
+(0700). If it is not a directory owned by this user with no group/other
+access, the cache is bypassed rather than trusting what is in it.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Per-user default so users sharing a temp dir never share (or squat) a cache
+_DEFAULT_DIR = f"ocr_cache-{os.getuid()}" if hasattr(os, "getuid") else "ocr_cache"
+OCR_CACHE_DIR = Path(os.getenv("OCR_CACHE_DIR", os.path.join(tempfile.gettempdir(), _DEFAULT_DIR)))
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES", "1024"))
+
+_untrusted: set = set()
+
+
+def _cache_dir() -> Optional[Path]:
+    """Return ``OCR_CACHE_DIR``, created private if missing, or None if it can't be trusted."""
+    path = OCR_CACHE_DIR
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    owner_ok = not hasattr(os, "getuid") or st.st_uid == os.getuid()
+    if stat.S_ISDIR(st.st_mode) and owner_ok and not st.st_mode & 0o077:
+        return path
+    if path not in _untrusted:
+        _untrusted.add(path)
+        logger.warning("OCR cache disabled: %s is not a private directory owned by this user", path)
+    return None
+
+
+def get(key: str) -> Optional[str]:
+    """Return cached text for ``key``, or None on a miss or unreadable entry."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        return orjson.loads((cache_dir / f"{key}.json").read_bytes())["text"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def put(key: str, text: str) -> None:
+    """Store ``text`` under ``key``; cache failures never fail the request."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        # Write-then-rename so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps({"text": text}))
+        os.replace(tmp, cache_dir / f"{key}.json")
+        _evict(cache_dir)
+    except OSError:
+        pass
+
+
+def _evict(cache_dir: Path) -> None:
+    entries = list(cache_dir.glob("*.json"))
+    excess = len(entries) - OCR_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda p: p.stat().st_mtime)
+    for path in entries[:excess]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
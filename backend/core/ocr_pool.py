@@ -0,0 +1,65 @@
+"""Process pool for CPU-bound OCR work.
+
+PaddleOCR inference plus the Python pre/post-processing around it holds the
+GIL, so running it on the event loop (or a thread) serializes concurrent
+uploads. Routes dispatch ``process_input`` here instead; each worker is a
+separate process and loads its OCR model once at startup.
+
+Pool size is controlled by ``OCR_WORKERS`` (defaults to the CPU count).
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Union
+
+from .ocr import get_ocr, process_input
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS") or os.cpu_count() or 1)
+
+
+def _init_worker() -> None:
+    # Pay model construction at worker startup instead of on the first request.
+    # A failing initializer would break the whole pool, so let the request path report errors.
+    try:
+        get_ocr()
+    except Exception:
+        pass
+
+
+# Created on first use and dropped by shutdown(), so every app lifespan
+# (server restart, repeated TestClient) gets a live pool
+_ocr_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _ocr_pool
+    with _pool_lock:
+        if _ocr_pool is None:
+            # Spawn rather than fork: the API process is multi-threaded by the time OCR runs
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=OCR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _ocr_pool
+
+
+async def run_ocr(source: Union[str, bytes], suffix: Optional[str] = None, lang: str = "en") -> str:
+    """Run ``process_input`` for a file path or in-memory document in the OCR process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), partial(process_input, source, lang=lang, suffix=suffix))
+
+
+def shutdown() -> None:
+    """Stop the workers; pending OCR jobs are cancelled. The next run_ocr starts a fresh pool."""
+    global _ocr_pool
+    with _pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
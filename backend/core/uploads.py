@@ -0,0 +1,149 @@
+"""Temporary on-disk spooling for uploaded documents.
+
+On Linux the upload is written to an anonymous ``O_TMPFILE`` inode, which
+never gets a directory entry: there is nothing to unlink and the data is
+released as soon as the descriptor is closed. Other platforms (or
+filesystems without ``O_TMPFILE`` support) fall back to a named temp file.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import queue
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, BinaryIO, Iterator, Tuple, Union
+
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+
+# Reusable copy buffers so large uploads don't allocate a fresh bytes object per request
+CHUNK_SIZE = 1 << 20
+_BUF_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=32)
+
+# Uploads up to this size are used from memory instead of being spooled.
+# Matches Starlette's own in-memory threshold, so these were never on disk.
+INLINE_MAX = int(os.getenv("UPLOAD_INLINE_MAX", str(1 << 20)))
+
+
+def _acquire() -> bytearray:
+    try:
+        return _BUF_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(CHUNK_SIZE)
+
+
+def _release(buf: bytearray) -> None:
+    try:
+        _BUF_POOL.put_nowait(buf)
+    except queue.Full:
+        pass
+
+
+def _open_anonymous() -> int | None:
+    """Return an fd for an unlinked temp inode, or None if unsupported."""
+    if not _O_TMPFILE:
+        return None
+    try:
+        return os.open(tempfile.gettempdir(), _O_TMPFILE | os.O_RDWR, 0o600)
+    except OSError:
+        return None
+
+
+def _write_all(fd: int, data) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _readinto(fileobj, view: memoryview) -> int:
+    try:
+        return fileobj.readinto(view)
+    except AttributeError:
+        # SpooledTemporaryFile only grew readinto in Python 3.11
+        data = fileobj.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+
+def _copy_into(fd: int, fileobj, view: memoryview, hasher=None) -> None:
+    while True:
+        n = _readinto(fileobj, view)
+        if not n:
+            break
+        if hasher is not None:
+            hasher.update(view[:n])
+        _write_all(fd, view[:n])
+
+
+@contextmanager
+def _spool(suffix: str) -> Iterator[Tuple[int, str]]:
+    """Yield ``(fd, path)`` for an empty temp file that is removed on exit.
+
+    The anonymous-file path is ``/proc/<pid>/fd/<fd>``; it is addressed
+    through our pid rather than /proc/self so it stays valid in helper
+    processes.
+    """
+    fd = _open_anonymous()
+    if fd is not None:
+        try:
+            yield fd, f"/proc/{os.getpid()}/fd/{fd}"
+        finally:
+            os.close(fd)
+        return
+
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        yield fd, path
+    finally:
+        os.close(fd)
+        os.unlink(path)
+
+
+@asynccontextmanager
+async def spooled_upload_file(upload, suffix: str = "", hasher=None) -> AsyncIterator[str]:
+    """Copy an ``UploadFile`` to a temp file and yield a path that reads it back.
+
+    The path may carry no extension; callers that dispatch on file type
+    must pass ``suffix`` along separately.
+
+    Data moves in ``CHUNK_SIZE`` pieces through a pooled buffer, so peak
+    memory is one chunk rather than the whole document. The copy loop runs
+    in a single worker-thread hop, keeping disk I/O off the event loop.
+    If ``hasher`` (a ``hashlib`` object) is given it is fed each chunk as it
+    is copied, so the content digest costs no extra pass over the data.
+    """
+    with _spool(suffix) as (fd, path):
+        buf = _acquire()
+        try:
+            with memoryview(buf) as view:
+                await asyncio.to_thread(_copy_into, fd, upload.file, view, hasher)
+        finally:
+            _release(buf)
+        yield path
+
+
+@asynccontextmanager
+async def upload_source(upload, suffix: str = "", hasher=None) -> AsyncIterator[Union[bytes, str]]:
+    """Yield a small upload's bytes, or a spooled path for anything larger.
+
+    Both forms are accepted by OCR and by :func:`open_source`, so small
+    documents never touch a temp file. ``hasher`` is fed the content either way.
+    """
+    size = getattr(upload, "size", None)
+    if size is not None and size <= INLINE_MAX:
+        content = await upload.read()
+        if hasher is not None:
+            hasher.update(content)
+        yield content
+        return
+    async with spooled_upload_file(upload, suffix=suffix, hasher=hasher) as path:
+        yield path
+
+
+def open_source(source: Union[bytes, str]) -> BinaryIO:
+    """Open an :func:`upload_source` value as a readable binary file."""
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return open(source, "rb", buffering=1 << 20)
@@ -13,6 +13,7 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Tuple, Any
 from rapidfuzz import fuzz
@@ -84,6 +85,37 @@ MONTH_MAP = {
     "dec": 12, "december": 12,
 }
 
+GENDER_MAP = {
+    # English & abbreviations
+    "m": "male", "male": "male", "man": "male", "boy": "male",
+    "f": "female", "female": "female", "woman": "female", "girl": "female",
+    "other": "other", "others": "other", "nb": "other", "non-binary": "other", "nonbinary": "other",
+    # Hindi (native script)
+    "पुरुष": "male", "आदमी": "male", "लड़का": "male", "लड़का": "male", "बालक": "male",
+    "महिला": "female", "स्त्री": "female", "नारी": "female", "लड़की": "female", "लड़की": "female",
+    "अन्य": "other", "दूसरे": "other",
+    # Hindi transliterations (after unidecode approximation)
+    "purush": "male", "aadmi": "male", "ladka": "male", "balak": "male",
+    "mahila": "female", "stree": "female", "naari": "female", "nari": "female", "ladki": "female",
+    "anya": "other", "dusre": "other",
+}
+
+# Devanagari digits -> ASCII
+_DEV_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+# Deletes every non-digit ASCII char; used for the all-ASCII phone/id fast path
+_ASCII_NON_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+# DOB separators, folded to spaces in one pass
+_DOB_SEPS = str.maketrans(".,/-", "    ")
+
+# Patterns used on every normalize / score call, compiled once at import
+_NON_DIGIT = re.compile(r"\D")
+_DATE_JUNK = re.compile(r"[^\w\s\-:,]")
+_DATE_SPLIT = re.compile(r"[-\s:]")
+_PUNCT = re.compile(r"[.,;:!?\-()\"'\/]")
+_WS = re.compile(r"\s+")
+_NUM_TOKEN = re.compile(r"\b\d+\b")
+_DOB_PREFIX = re.compile(r"dob[^0-9a-z]+")
+
 # -----------------------------
 # Normalization functions
 # -----------------------------
@@ -98,7 +130,12 @@ def normalize_unicode(s: str) -> str:
     """
     if not s:
         return ""
-    s = unicodedata.normalize("NFKD", str(s))
+    s = str(s)
+    if s.isascii():
+        # NFKD and transliteration are no-ops on ASCII; only control chars need stripping
+        # (for ASCII, "not printable" is exactly category C)
+        return s if s.isprintable() else "".join(ch for ch in s if ch.isprintable())
+    s = unicodedata.normalize("NFKD", s)
     s = unidecode(s)
     s = "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
     return s
@@ -107,12 +144,11 @@ def normalize_digits(s: str) -> str:
     """Return digits only (useful for phone / id)."""
     if not s:
         return ""
+    s2 = str(s)
+    if s2.isascii():
+        return s2.translate(_ASCII_NON_DIGITS)
     # Map Devanagari digits to ASCII before stripping
-    dev_map = str.maketrans({
-        '०': '0','१': '1','२': '2','३': '3','४': '4','५': '5','६': '6','७': '7','८': '8','९': '9'
-    })
-    s2 = str(s).translate(dev_map)
-    return re.sub(r"\D", "", s2)
+    return _NON_DIGIT.sub("", s2.translate(_DEV_DIGITS))
 
 def normalize_date(s: str) -> str:
     """
@@ -122,14 +158,14 @@ def normalize_date(s: str) -> str:
     if not s:
         return ""
     s0 = str(s).strip().replace(".", "-").replace("/", "-")
-    s0 = re.sub(r"[^\w\s\-:,]", "", s0)
+    s0 = _DATE_JUNK.sub("", s0)
     for fmt in COMMON_DATE_FORMATS:
         try:
             return datetime.strptime(s0, fmt).date().isoformat()
         except Exception:
             pass
     # heuristic: numeric parts
-    parts = re.split(r"[-\s:]", s0)
+    parts = _DATE_SPLIT.split(s0)
     digits = [p for p in parts if p.isdigit()]
     if len(digits) == 3:
         d1, d2, d3 = digits
@@ -140,16 +176,21 @@ def normalize_date(s: str) -> str:
                 pass
     return ""
 
+# Word followed only by trailing punctuation ("st." -> "st")
+_TOKEN_TAIL = re.compile(r"^(\w+)[^\w]*$")
+
 def expand_abbreviations(s: str) -> str:
     """Replace common abbreviations / Hindi tokens in tokens (st -> street, मार्ग -> road)."""
     if not s:
         return ""
-    words = s.split()
     out = []
-    for w in words:
-        # preserve tokens like "st." to map via ABBR
-        w_clean = re.sub(r"^([\w]+)[^\w]*$", r"\1", w.lower())
-        out.append(ABBR.get(w_clean, w_clean))
+    for w in s.lower().split():
+        # preserve tokens like "st." to map via ABBR; plain alphanumeric tokens need no stripping
+        if not w.isalnum():
+            m = _TOKEN_TAIL.match(w)
+            if m:
+                w = m.group(1)
+        out.append(ABBR.get(w, w))
     return " ".join(out)
 
 def remove_stopwords(s: str) -> str:
@@ -162,9 +203,16 @@ def normalize_full(s: str, field_type: str = "generic") -> str:
     """
     Full normalization pipeline.
     - field_type: "generic" (names/addresses), "phone", "date", "id"
+    Results are memoized per (text, field_type); see _normalize_full_cached.
     """
     if not s:
         return ""
+    # Coerce first so unhashable or non-str values still hit the cache
+    return _normalize_full_cached(str(s), field_type)
+
+@lru_cache(maxsize=8192)
+def _normalize_full_cached(s: str, field_type: str) -> str:
+    # Pure function of its inputs; the same field values recur across requests
     s = normalize_unicode(s)
     if field_type in ("phone", "id"):
         return normalize_digits(s)
@@ -173,11 +221,11 @@ def normalize_full(s: str, field_type: str = "generic") -> str:
     # generic text (name / address)
     s = s.lower().strip()
     # replace common punctuation with space
-    s = re.sub(r"[.,;:!?\-()\"'\/]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _PUNCT.sub(" ", s)
+    s = _WS.sub(" ", s).strip()
     s = expand_abbreviations(s)
     s = remove_stopwords(s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS.sub(" ", s).strip()
     return s
 
 # -----------------------------
@@ -242,12 +290,12 @@ def address_score(a: str, b: str) -> float:
     s_partial = fuzz.partial_ratio(an, bn) / 100.0
     s_token = fuzz.token_sort_ratio(an, bn) / 100.0
     s_set = fuzz.token_set_ratio(an, bn) / 100.0
-    s_w = getattr(fuzz, "WRatio", lambda x, y: 0)(an, bn) / 100.0
+    s_w = fuzz.WRatio(an, bn) / 100.0
     s_raw = max(s_token, s_set, s_w, s_partial)
 
     # Bonus for matching numeric tokens like house/flat numbers
-    nums_a = set(re.findall(r"\b\d+\b", an))
-    nums_b = set(re.findall(r"\b\d+\b", bn))
+    nums_a = set(_NUM_TOKEN.findall(an))
+    nums_b = set(_NUM_TOKEN.findall(bn))
     bonus_num = 0.0
     if nums_a and nums_b:
         inter = len(nums_a & nums_b)
@@ -274,6 +322,9 @@ def address_score(a: str, b: str) -> float:
     total_bonus = min(0.08, bonus_num + bonus_jacc)
     return min(1.0, s_raw_adjusted + total_bonus)
 
+# (shared trailing digits, score), longest first
+_PHONE_SUFFIX_CREDIT = ((9, 0.95), (8, 0.9), (7, 0.85), (6, 0.80))
+
 def phone_score(a: str, b: str) -> float:
     """Compare phones robustly with country codes/trunk prefixes.
 
@@ -289,35 +340,21 @@ def phone_score(a: str, b: str) -> float:
     if da == db:
         return 1.0
 
-    # Helper: split into (country_code, nsn) where nsn ~ last 10 digits when available
-    def split_phone(d: str) -> Tuple[str, str]:
-        if not d:
-            return "", ""
-        if len(d) >= 10:
-            nsn = d[-10:]
-            cc = d[:-10].lstrip('0')
-        else:
-            nsn = d
-            cc = ""
-        return cc, nsn
-
-    cc_a, nsn_a = split_phone(da)
-    cc_b, nsn_b = split_phone(db)
-
-    if nsn_a and nsn_b and nsn_a == nsn_b:
+    # NSN ~ last 10 digits when available; a shared 10-digit tail is a full match
+    nsn_a = da[-10:]
+    nsn_b = db[-10:]
+    if nsn_a == nsn_b:
         return 1.0
 
     # Partial suffix matches (area code differences). Give partial credit.
-    for k, val in ((9, 0.95), (8, 0.9), (7, 0.85), (6, 0.80)):
-        if len(da) >= k and len(db) >= k and da[-k:] == db[-k:]:
+    la, lb = len(da), len(db)
+    for k, val in _PHONE_SUFFIX_CREDIT:
+        if la >= k and lb >= k and da[-k:] == db[-k:]:
             return val
 
-    # Fall back: digit similarity on NSN (or full digits if short)
-    x = nsn_a or da
-    y = nsn_b or db
+    # Fall back: digit similarity on NSN (the full digits if short)
+    x, y = nsn_a, nsn_b
     ld = max(len(x), len(y))
-    if ld == 0:
-        return 0.0
     diff = sum(1 for p, q in zip(x.zfill(ld), y.zfill(ld)) if p != q) + abs(len(x) - len(y))
     # minimum denominator to avoid harsh penalty on short numbers
     score = max(0.0, 1 - diff / max(6, ld))
@@ -329,9 +366,7 @@ def dob_score(a: str, b: str) -> float:
         if not x:
             return {"ymd": "", "md": ""}
         raw = str(x).lower()
-        raw = re.sub(r"dob[^0-9a-z]+", " ", raw)
-        for ch in [".", "/", "-", ","]:
-            raw = raw.replace(ch, " ")
+        raw = _DOB_PREFIX.sub(" ", raw).translate(_DOB_SEPS)
         toks = [t for t in raw.split() if t]
         nums = []
         mon = None
@@ -372,11 +407,9 @@ def dob_score(a: str, b: str) -> float:
             ymd = f"{year:04d}-{str(month).zfill(2)}-{str(day).zfill(2)}"
         return {"ymd": ymd, "md": md}
 
-    da = normalize_full(a, "date")
-    db = normalize_full(b, "date")
-
-    loose_a = parse_loose(a or da)
-    loose_b = parse_loose(b or db)
+    # parse_loose handles the raw strings directly; a strptime pass would only be discarded
+    loose_a = parse_loose(a)
+    loose_b = parse_loose(b)
 
     # Exact ISO match
     if loose_a["ymd"] and loose_b["ymd"] and loose_a["ymd"] == loose_b["ymd"]:
@@ -397,8 +430,8 @@ def dob_score(a: str, b: str) -> float:
             d = f"0{d}"
         return d
 
-    da_d = digits_only(a or da)
-    db_d = digits_only(b or db)
+    da_d = digits_only(a)
+    db_d = digits_only(b)
     if da_d and db_d and da_d == db_d:
         return 1.0
 
@@ -406,23 +439,9 @@ def dob_score(a: str, b: str) -> float:
 
 def gender_score(a: str, b: str) -> float:
     """Strict gender matching using defined synonym mapping only."""
-    mapping = {
-        # English & abbreviations
-        "m": "male", "male": "male", "man": "male", "boy": "male",
-        "f": "female", "female": "female", "woman": "female", "girl": "female",
-        "other": "other", "others": "other", "nb": "other", "non-binary": "other", "nonbinary": "other",
-        # Hindi (native script)
-        "पुरुष": "male", "आदमी": "male", "लड़का": "male", "लड़का": "male", "बालक": "male",
-        "महिला": "female", "स्त्री": "female", "नारी": "female", "लड़की": "female", "लड़की": "female",
-        "अन्य": "other", "दूसरे": "other",
-        # Hindi transliterations (after unidecode approximation)
-        "purush": "male", "aadmi": "male", "ladka": "male", "balak": "male",
-        "mahila": "female", "stree": "female", "naari": "female", "nari": "female", "ladki": "female",
-        "anya": "other", "dusre": "other",
-    }
     def norm(x: str) -> str:
         x = (x or "").strip().lower()
-        return mapping.get(x, x)
+        return GENDER_MAP.get(x, x)
     an = norm(a)
     bn = norm(b)
     return 1.0 if an and an == bn else 0.0
@@ -5,11 +5,11 @@ Provides OCR services for both images and PDFs
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional
-import tempfile
 import os
 
 # Import A1's OCR logic
-from ..core.ocr import process_input
+from ..core.ocr_pool import run_ocr
+from ..core.uploads import upload_source
 
 router = APIRouter(prefix="/ocr", tags=["OCR Extraction"])
 
@@ -28,19 +28,13 @@ async def extract_text_from_file(file: UploadFile = File(...)):
     Returns raw extracted text for A2 to process
     """
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        try:
+        suffix = os.path.splitext(file.filename)[1].lower()
+        file_type = "pdf" if suffix == ".pdf" else "image"
+
+        # Small uploads go to OCR from memory; larger ones via a temp file removed when the block exits
+        async with upload_source(file, suffix=suffix) as source:
             # Process with A1's OCR logic
-            extracted_text = process_input(tmp_path)
-            
-            # Determine file type
-            file_ext = os.path.splitext(file.filename)[1].lower()
-            file_type = "pdf" if file_ext == ".pdf" else "image"
+            extracted_text = await run_ocr(source, suffix=suffix)
             
             return OCRResponse(
                 status="success",
@@ -48,10 +42,6 @@ async def extract_text_from_file(file: UploadFile = File(...)):
                 file_type=file_type
             )
             
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
-            
     except Exception as e:
         raise HTTPException(
             status_code=500, 
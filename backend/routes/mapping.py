@@ -1,13 +1,20 @@
+import os
+
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Dict, List, Optional
-from datetime import datetime, date
+from datetime import date
 
 from ..core.mapper import field_mapper
 from ..core.verifier import verify
+from .verification import parse_dob
 
 router = APIRouter(tags=["Field Extraction"])
 
+# Upper bound on items per /map-and-verify/batch request
+MAP_VERIFY_BATCH_MAX = int(os.getenv("MAP_VERIFY_BATCH_MAX", "256"))
+
 
 class ExtractionRequest(BaseModel):
     raw_text: str
@@ -30,6 +37,19 @@ class MapAndVerifyResponse(BaseModel):
     missing_fields: List[str]
     verification: Dict[str, object]
 
+class MapAndVerifyBatchItem(MapAndVerifyRequest):
+    id: Optional[str] = None  # echoed back so callers can match results to inputs
+
+class MapAndVerifyBatchRequest(BaseModel):
+    items: List[MapAndVerifyBatchItem]
+
+class MapAndVerifyBatchResult(MapAndVerifyResponse):
+    id: Optional[str] = None
+
+class MapAndVerifyBatchResponse(BaseModel):
+    status: str
+    results: List[MapAndVerifyBatchResult]
+
 @router.post("/extract-fields", response_model=ExtractionResponse)
 async def extract_fields(request: ExtractionRequest):
    
@@ -48,88 +68,106 @@ async def extract_fields(request: ExtractionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
 
+def _map_and_verify(req: MapAndVerifyRequest) -> MapAndVerifyResponse:
+    """Extract fields from req.raw_text and verify them against req.user."""
+    mapped = field_mapper.extract_fields(req.raw_text, document_type=req.document_type)
+    requested = (req.document_type or "").lower()
+
+    missing = field_mapper.get_missing_fields(mapped)
+    # Determine relevant field(s) for verification based on document type
+    doc_map = {
+        "aadhar": ["name"],
+        "voter": ["name"],
+        # For address docs, also keep city/state/pincode if present
+        "dl": ["address", "city", "state", "pincode"],
+        "passport": ["address", "city", "state", "pincode"],
+        "birth": ["dob"],
+        "slc": ["dob"],
+        # For handwritten, show all extracted fields
+        "handwritten": None,
+    }
+    keys = doc_map.get(requested)
+    if keys is None:
+        # Do not restrict; use all extracted fields
+        pass
+    elif not keys:
+        # default: verify standard keys if doc_type unknown
+        keys = ["name", "dob", "phone", "address", "gender"]
+
+    # Ensure mapped only includes relevant keys for UI clarity (skip for handwritten)
+    if keys is not None:
+        mapped = {k: v for k, v in mapped.items() if k in keys}
+        ocr_subset = {k: v for k, v in mapped.items() if k in keys}
+        user_subset = {k: v for k, v in req.user.items() if k in keys}
+    else:
+        # Handwritten/all-fields: keep mapped as-is for display, but verify only known canonical keys
+        verify_keys = {"name", "dob", "phone", "address", "gender"}
+        ocr_subset = {k: v for k, v in mapped.items() if k in verify_keys}
+        user_subset = {k: v for k, v in req.user.items() if k in verify_keys}
+
+    # If there is no overlap of non-empty fields, skip verification instead of returning 0%
+    overlap = [k for k in ocr_subset if k in user_subset and ocr_subset.get(k) not in (None, "") and user_subset.get(k) not in (None, "")]
+    if not overlap:
+        # No overlapping non-empty fields: give a conservative partial score instead of hard 0
+        verification = {
+            "overall_confidence": 0.75,
+            "decision": "REVIEW",
+            "fields": {},
+            "notes": ["verification_skipped_no_overlap"],
+        }
+    else:
+        verification = verify(ocr_subset, user_subset)
+
+    # Age consistency note (auxiliary; does not affect scoring)
+    if mapped.get("dob") and mapped.get("age"):
+        parsed = parse_dob(mapped["dob"])
+        if parsed:
+            today = date.today()
+            derived_age = int((today - parsed).days / 365.25)
+            try:
+                stated_age = int(mapped["age"])
+                if abs(derived_age - stated_age) > 1:
+                    verification.setdefault("notes", []).append(
+                        f"age_mismatch(derived={derived_age}, stated={stated_age})"
+                    )
+            except ValueError:
+                verification.setdefault("notes", []).append("age_parse_error")
+    return MapAndVerifyResponse(
+        status="success",
+        mapped=mapped,
+        missing_fields=missing,
+        verification=verification
+    )
+
 @router.post("/map-and-verify", response_model=MapAndVerifyResponse)
 async def map_and_verify(req: MapAndVerifyRequest):
     try:
-        mapped = field_mapper.extract_fields(req.raw_text, document_type=req.document_type)
-        requested = (req.document_type or "").lower()
-
-        missing = field_mapper.get_missing_fields(mapped)
-        # Determine relevant field(s) for verification based on document type
-        doc_map = {
-            "aadhar": ["name"],
-            "voter": ["name"],
-            # For address docs, also keep city/state/pincode if present
-            "dl": ["address", "city", "state", "pincode"],
-            "passport": ["address", "city", "state", "pincode"],
-            "birth": ["dob"],
-            "slc": ["dob"],
-            # For handwritten, show all extracted fields
-            "handwritten": None,
-        }
-        keys = doc_map.get(requested)
-        if keys is None:
-            # Do not restrict; use all extracted fields
-            pass
-        elif not keys:
-            # default: verify standard keys if doc_type unknown
-            keys = ["name", "dob", "phone", "address", "gender"]
-
-        # Ensure mapped only includes relevant keys for UI clarity (skip for handwritten)
-        if keys is not None:
-            mapped = {k: v for k, v in mapped.items() if k in keys}
-            ocr_subset = {k: v for k, v in mapped.items() if k in keys}
-            user_subset = {k: v for k, v in req.user.items() if k in keys}
-        else:
-            # Handwritten/all-fields: keep mapped as-is for display, but verify only known canonical keys
-            verify_keys = {"name", "dob", "phone", "address", "gender"}
-            ocr_subset = {k: v for k, v in mapped.items() if k in verify_keys}
-            user_subset = {k: v for k, v in req.user.items() if k in verify_keys}
-
-        # If there is no overlap of non-empty fields, skip verification instead of returning 0%
-        overlap = [k for k in ocr_subset if k in user_subset and ocr_subset.get(k) not in (None, "") and user_subset.get(k) not in (None, "")]
-        if not overlap:
-            # No overlapping non-empty fields: give a conservative partial score instead of hard 0
-            verification = {
-                "overall_confidence": 0.75,
-                "decision": "REVIEW",
-                "fields": {},
-                "notes": ["verification_skipped_no_overlap"],
-            }
-        else:
-            verification = verify(ocr_subset, user_subset)
-
-        # Age consistency note (auxiliary; does not affect scoring)
-        if mapped.get("dob") and mapped.get("age"):
-            dob_norm = mapped["dob"].strip()
-            # Try multiple date formats already handled in verifier; reuse normalization by simple parse attempts
-            parsed = None
-            for fmt in ("%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%d-%m-%y", "%d/%m/%y"):
-                try:
-                    parsed = datetime.strptime(dob_norm.replace('/', '-'), fmt.replace('/', '-')).date()
-                    break
-                except Exception:
-                    continue
-            if parsed:
-                today = date.today()
-                derived_age = int((today - parsed).days / 365.25)
-                try:
-                    stated_age = int(mapped["age"])
-                    if abs(derived_age - stated_age) > 1:
-                        verification.setdefault("notes", []).append(
-                            f"age_mismatch(derived={derived_age}, stated={stated_age})"
-                        )
-                except ValueError:
-                    verification.setdefault("notes", []).append("age_parse_error")
-        return MapAndVerifyResponse(
-            status="success",
-            mapped=mapped,
-            missing_fields=missing,
-            verification=verification
-        )
+        return _map_and_verify(req)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Map+Verify failed: {e}")
 
+@router.post("/map-and-verify/batch", response_model=MapAndVerifyBatchResponse)
+async def map_and_verify_batch(req: MapAndVerifyBatchRequest):
+    """
+    Run /map-and-verify over many items in one request.
+    Results come back in input order, each tagged with the item's id.
+    """
+    if len(req.items) > MAP_VERIFY_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {MAP_VERIFY_BATCH_MAX} items per batch")
+
+    def run_all() -> List[MapAndVerifyBatchResult]:
+        return [
+            MapAndVerifyBatchResult(id=item.id, **_map_and_verify(item).model_dump())
+            for item in req.items
+        ]
+
+    try:
+        # One thread hop for the whole batch keeps the CPU-bound scoring off the event loop
+        results = await run_in_threadpool(run_all)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Map+Verify batch failed: {e}")
+    return MapAndVerifyBatchResponse(status="success", results=results)
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
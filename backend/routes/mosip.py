@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
-import tempfile
-from typing import Any, Dict, Optional, List
+import weakref
+from collections import OrderedDict
+from contextlib import AsyncExitStack, aclosing
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple, Union
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+import anyio
+import orjson
+from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from ..core import ocr_cache
 from ..core.mosip_client import MOSIPClient
-from ..core.ocr import process_input as extract_text
+from ..core.ocr_pool import run_ocr as extract_text
 from ..core.verifier import verify as verify_data
 from ..core.mapper import field_mapper
+from ..core.uploads import open_source, upload_source
 from .verification import map_input_keys
 
 router = APIRouter(prefix="/mosip", tags=["MOSIP Pre-registration"])
@@ -20,11 +27,70 @@ logger = logging.getLogger(__name__)
 
 MOSIP_BASE_URL = os.getenv("MOSIP_BASE_URL", "https://sandbox.mosip.net")
 MOSIP_AUTH_TOKEN = os.getenv("MOSIP_AUTH_TOKEN", "")
+# Per-batch cap on files concurrently in OCR or upload
+MOSIP_CONCURRENCY = int(os.getenv("MOSIP_CONCURRENCY", "4"))
+# Process-wide cap on MOSIP calls in flight, across all requests
+MOSIP_MAX_INFLIGHT = int(os.getenv("MOSIP_MAX_INFLIGHT", "8"))
+RETRYABLE_STATUS = {429, 502, 503, 504}
+# Full results kept for GET /results/{id} when responses are compact
+MOSIP_RESULTS_MAX = int(os.getenv("MOSIP_RESULTS_MAX", "1024"))
 
 if not MOSIP_AUTH_TOKEN:
     logger.warning("MOSIP_AUTH_TOKEN not set. MOSIP integration will fail.")
 
 mosip_client = MOSIPClient(MOSIP_BASE_URL, MOSIP_AUTH_TOKEN)
+# asyncio primitives bind to the loop that first uses them, so keep one per loop
+_slots_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+# Fields dropped from compact (non-verbose) responses
+_ECHO_KEYS = frozenset({"extracted_data", "pre_registration_response", "document_upload_response", "upload"})
+
+
+def _remember(pre_reg_id: str, result: Dict[str, Any]) -> None:
+    """Keep the full result for later lookup, evicting the oldest past the cap."""
+    _results[pre_reg_id] = result
+    _results.move_to_end(pre_reg_id)
+    while len(_results) > MOSIP_RESULTS_MAX:
+        _results.popitem(last=False)
+
+
+def _mosip_slots() -> asyncio.Semaphore:
+    """Cap on MOSIP calls in flight, shared by every request on the running loop."""
+    loop = asyncio.get_running_loop()
+    slots = _slots_by_loop.get(loop)
+    if slots is None:
+        slots = _slots_by_loop[loop] = asyncio.Semaphore(MOSIP_MAX_INFLIGHT)
+    return slots
+
+
+def _is_retryable(err: Exception) -> bool:
+    """Rate limiting and gateway errors are transient; anything else is not."""
+    status = getattr(err, "status_code", None)
+    if status is None:
+        status = getattr(getattr(err, "response", None), "status_code", None)
+    if status in RETRYABLE_STATUS:
+        return True
+    msg = str(err).lower()
+    return "rate limit" in msg or "quota" in msg
+
+
+async def _call_mosip(fn, *args, max_attempts: int = 3, base: float = 0.5, cap: float = 8.0):
+    """Await a MOSIP client coroutine, retrying transient failures.
+
+    Waits ``min(cap, base * 2**attempt)`` seconds between attempts.
+    """
+    for attempt in range(max_attempts):
+        try:
+            async with _mosip_slots():
+                return await fn(*args)
+        except Exception as err:
+            if attempt + 1 >= max_attempts or not _is_retryable(err):
+                raise
+            delay = min(cap, base * 2 ** attempt)
+            logger.warning("MOSIP call %s failed (%s); retrying in %.1fs", getattr(fn, "__name__", fn), err, delay)
+            await asyncio.sleep(delay)
 
 
 def _passes_verification(verification_results: Dict[str, Any], threshold: float = 0.85) -> bool:
@@ -37,10 +103,41 @@ def _passes_verification(verification_results: Dict[str, Any], threshold: float
         return overall >= threshold
 
     fields = verification_results.get("fields") or verification_results
-    numeric_scores = [float(v) for v in fields.values() if isinstance(v, (int, float))]
-    if not numeric_scores:
-        return True
-    return min(numeric_scores) >= threshold
+    # Single pass that stops at the first failing score; no numeric scores passes
+    return all(v >= threshold for v in fields.values() if isinstance(v, (int, float)))
+
+
+async def _extract_cached(source: Union[bytes, str], suffix: str, digest: str, no_cache: bool = False) -> str:
+    """OCR the upload, reusing the stored text for previously seen content."""
+    key = f"{digest}{suffix.lower()}"
+    if not no_cache:
+        cached = await asyncio.to_thread(ocr_cache.get, key)
+        if cached is not None:
+            return cached
+    extracted_data = await extract_text(source, suffix=suffix)
+    if extracted_data:
+        await asyncio.to_thread(ocr_cache.put, key, extracted_data)
+    return extracted_data
+
+
+async def _upload_source(pre_reg_id: str, source: Union[bytes, str], filename: str) -> Dict[str, Any]:
+    """Upload the document from memory or its spool, through a single handle."""
+    with open_source(source) as document:
+        return await _call_mosip(mosip_client.upload_document, pre_reg_id, document, filename)
+
+
+async def _upload_if_registered(pre_reg_id: Optional[str], source: Union[bytes, str], filename: str) -> Dict[str, Any]:
+    if not pre_reg_id:
+        return {}
+    return await _upload_source(pre_reg_id, source, filename)
+
+
+def _parse_verification_data(raw: str) -> Tuple[Any, ...]:
+    """Parse the batch ``verification_data`` JSON array into a tuple of per-file entries."""
+    parsed = orjson.loads(raw)
+    if not isinstance(parsed, list):
+        raise ValueError("verification_data must be a JSON array")
+    return tuple(parsed)
 
 
 @router.post("/integrate", summary="Complete OCR → Verification → MOSIP Registration")
@@ -48,6 +145,8 @@ async def integrate_with_mosip(
     file: UploadFile = File(..., description="Document to process (PDF/PNG/JPG)"),
     manual_data: Optional[str] = Form(None, description="Optional manual data for verification"),
     verification_threshold: float = Form(0.8, description="Verification confidence threshold"),
+    verbose: bool = Form(False, description="Echo extracted text and raw MOSIP responses in the response"),
+    no_cache: bool = Query(False, description="Force OCR even if this document was seen before"),
 ):
     """
     Workflow:
@@ -57,94 +156,101 @@ async def integrate_with_mosip(
     4) Upload the document
     """
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-
-        logger.info("Processing file for MOSIP integration: %s", file.filename)
-
-        extracted_data = extract_text(tmp_path)
-        if not extracted_data:
-            raise HTTPException(status_code=400, detail="Failed to extract data from document")
+        suffix = os.path.splitext(file.filename)[1]
+        # The source (bytes, or a temp file for large uploads) backs both OCR and the
+        # MOSIP upload; any temp file is removed on every exit path
+        hasher = hashlib.sha256()
+        async with upload_source(file, suffix=suffix, hasher=hasher) as source:
+            logger.info("Processing file for MOSIP integration: %s", file.filename)
+
+            extracted_data = await _extract_cached(source, suffix, hasher.hexdigest(), no_cache)
+            if not extracted_data:
+                raise HTTPException(status_code=400, detail="Failed to extract data from document")
+
+            # Map raw OCR text into structured fields before verification
+            mapped_fields = field_mapper.extract_fields(extracted_data) if isinstance(extracted_data, str) else {}
+
+            verification_results: Dict[str, Any] = {}
+            if manual_data:
+                try:
+                    raw_manual = orjson.loads(manual_data)
+                    manual_lower = { (k or "").lower(): v for k, v in raw_manual.items() }
+                    manual_dict = map_input_keys(manual_lower)
+
+                    # Verify only when we have overlapping fields extracted; otherwise skip blocking
+                    common = mapped_fields.keys() & manual_dict.keys()
+                    pairs = [(k, mapped_fields[k], manual_dict[k]) for k in common if mapped_fields[k] and manual_dict[k]]
+                    if not pairs:
+                        verification_results = {"status": "skipped", "reason": "no_overlap_fields"}
+                    else:
+                        overlap = {k: mv for k, mv, _ in pairs}
+                        user_overlap = {k: uv for k, _, uv in pairs}
+                        verification_results = verify_data(overlap, user_overlap)
+                        if verification_results and not _passes_verification(verification_results, verification_threshold):
+                            return ORJSONResponse(
+                                status_code=400,
+                                content={
+                                    "status": "verification_failed",
+                                    "message": "Data verification failed. Confidence below threshold.",
+                                    "extracted_data": extracted_data,
+                                    "mapped_fields": mapped_fields,
+                                    "manual_data": manual_dict,
+                                    "verification_results": verification_results,
+                                    "threshold": verification_threshold,
+                                },
+                            )
+                except orjson.JSONDecodeError:
+                    logger.warning("Invalid manual_data JSON format")
+                except Exception as err:
+                    logger.warning("Verification error: %s", err)
 
-        # Map raw OCR text into structured fields before verification
-        mapped_fields = field_mapper.extract_fields(extracted_data) if isinstance(extracted_data, str) else {}
-
-        verification_results: Dict[str, Any] = {}
-        if manual_data:
             try:
-                raw_manual = json.loads(manual_data)
-                manual_lower = { (k or "").lower(): v for k, v in raw_manual.items() }
-                manual_dict = map_input_keys(manual_lower)
-
-                # Verify only when we have overlapping fields extracted; otherwise skip blocking
-                overlap = {k: v for k, v in mapped_fields.items() if k in manual_dict and v}
-                if overlap:
-                    user_overlap = {k: manual_dict[k] for k in overlap.keys() if manual_dict.get(k) not in (None, "")}
-                    verification_results = verify_data(overlap, user_overlap)
-                    if verification_results and not _passes_verification(verification_results, verification_threshold):
-                        return JSONResponse(
-                            status_code=400,
-                            content={
-                                "status": "verification_failed",
-                                "message": "Data verification failed. Confidence below threshold.",
-                                "extracted_data": extracted_data,
-                                "mapped_fields": mapped_fields,
-                                "manual_data": manual_dict,
-                                "verification_results": verification_results,
-                                "threshold": verification_threshold,
-                            },
-                        )
-                else:
-                    verification_results = {"status": "skipped", "reason": "no_overlap_fields"}
-            except json.JSONDecodeError:
-                logger.warning("Invalid manual_data JSON format")
-            except Exception as err:
-                logger.warning("Verification error: %s", err)
-
-        try:
-            pre_reg_response = mosip_client.create_pre_registration({"raw_text": extracted_data})
-            pre_reg_id = pre_reg_response.get("response", {}).get("preRegistrationId")
-            if not pre_reg_id:
-                logger.error("No pre-registration ID returned: %s", pre_reg_response)
-                return JSONResponse(
-                    status_code=500,
+                pre_reg_response = await _call_mosip(mosip_client.create_pre_registration, {"raw_text": extracted_data})
+                pre_reg_id = pre_reg_response.get("response", {}).get("preRegistrationId")
+                if not pre_reg_id:
+                    logger.error("No pre-registration ID returned: %s", pre_reg_response)
+                    return ORJSONResponse(
+                        status_code=500,
+                        content={
+                            "status": "mosip_error",
+                            "message": "MOSIP did not return a pre-registration ID",
+                            "mosip_response": pre_reg_response,
+                            "extracted_data": extracted_data,
+                        },
+                    )
+
+                upload_response = await _upload_source(pre_reg_id, source, file.filename)
+
+                result = {
+                    "status": "success",
+                    "message": "Successfully registered with MOSIP",
+                    "pre_registration_id": pre_reg_id,
+                    "extracted_data": extracted_data,
+                    "verification_results": verification_results,
+                    "pre_registration_response": pre_reg_response,
+                    "document_upload_response": upload_response,
+                    "next_steps": {
+                        "check_status": f"/api/v1/mosip/status/{pre_reg_id}",
+                        "full_result": f"/api/v1/mosip/results/{pre_reg_id}",
+                        "mosip_portal": f"{MOSIP_BASE_URL}/pre-registration",
+                    },
+                }
+                _remember(pre_reg_id, result)
+                if verbose:
+                    return result
+                # The echoes scale with document size; they stay retrievable via next_steps.full_result
+                return {k: v for k, v in result.items() if k not in _ECHO_KEYS}
+            except Exception as mosip_error:
+                logger.error("MOSIP integration error: %s", mosip_error)
+                return ORJSONResponse(
+                    status_code=502,
                     content={
-                        "status": "mosip_error",
-                        "message": "MOSIP did not return a pre-registration ID",
-                        "mosip_response": pre_reg_response,
+                        "status": "mosip_integration_error",
+                        "message": f"Failed to integrate with MOSIP: {mosip_error}",
                         "extracted_data": extracted_data,
+                        "verification_results": verification_results,
                     },
                 )
-
-            upload_response = mosip_client.upload_document(pre_reg_id, tmp_path)
-            os.unlink(tmp_path)
-
-            return {
-                "status": "success",
-                "message": "Successfully registered with MOSIP",
-                "pre_registration_id": pre_reg_id,
-                "extracted_data": extracted_data,
-                "verification_results": verification_results,
-                "pre_registration_response": pre_reg_response,
-                "document_upload_response": upload_response,
-                "next_steps": {
-                    "check_status": f"/api/v1/mosip/status/{pre_reg_id}",
-                    "mosip_portal": f"{MOSIP_BASE_URL}/pre-registration",
-                },
-            }
-        except Exception as mosip_error:
-            logger.error("MOSIP integration error: %s", mosip_error)
-            return JSONResponse(
-                status_code=502,
-                content={
-                    "status": "mosip_integration_error",
-                    "message": f"Failed to integrate with MOSIP: {mosip_error}",
-                    "extracted_data": extracted_data,
-                    "verification_results": verification_results,
-                },
-            )
     except Exception as e:
         logger.error("Integration error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -161,7 +267,7 @@ async def verify_and_submit_to_mosip(
         if not skip_verification and manual_data:
             verification_results = verify_data(extracted_data, manual_data)
 
-        pre_reg_response = mosip_client.create_pre_registration(extracted_data)
+        pre_reg_response = await _call_mosip(mosip_client.create_pre_registration, extracted_data)
         return {
             "status": "success",
             "verification_results": verification_results,
@@ -175,66 +281,243 @@ async def verify_and_submit_to_mosip(
 @router.get("/status/{pre_reg_id}", summary="Get MOSIP pre-registration status")
 async def get_mosip_status(pre_reg_id: str):
     try:
-        status = mosip_client.get_application_status(pre_reg_id)
+        status = await _call_mosip(mosip_client.get_application_status, pre_reg_id)
         return {"pre_registration_id": pre_reg_id, "status": status}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/results/{pre_reg_id}", summary="Get the full result of a MOSIP submission")
+async def get_mosip_result(pre_reg_id: str):
+    result = _results.get(pre_reg_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No stored result for this pre-registration ID")
+    return result
+
+
 @router.get("/test", summary="Test MOSIP connection")
 async def test_mosip_connection():
     try:
         test_data = {"Name": "Test User", "Gender": "Male", "Date_of_Birth": "1990-01-01"}
-        response = mosip_client.create_pre_registration(test_data)
+        response = await _call_mosip(mosip_client.create_pre_registration, test_data)
         return {"status": "connected", "mosip_base_url": MOSIP_BASE_URL, "test_response": response}
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Failed to connect to MOSIP: {e}")
 
 
+async def _wait_out(futures: List["asyncio.Future[Any]"]) -> None:
+    """Wait for ``futures`` to finish even while this task is being cancelled.
+
+    Starlette stops a stream through an anyio cancel scope, which keeps
+    re-delivering the cancellation until the task exits, so a plain await
+    would be cut short. The shield stops that re-delivery and the loop
+    absorbs any cancellation already in flight; it is re-raised once every
+    future is done.
+    """
+    pending = set(futures)
+    cancelled = False
+    with anyio.CancelScope(shield=True):
+        while pending:
+            try:
+                _, pending = await asyncio.wait(pending)
+            except asyncio.CancelledError:
+                cancelled = True
+    if cancelled:
+        raise asyncio.CancelledError
+
+
+async def _open_batch_sources(files: List[UploadFile], spools: AsyncExitStack) -> List[Any]:
+    """Copy each upload into a source owned by ``spools``.
+
+    Returns ``(source, suffix, digest)`` per file, or the exception that file
+    raised. Once copied, results no longer depend on the request's upload
+    handles, which may be closed before a streamed response is produced.
+    """
+    sem = asyncio.Semaphore(MOSIP_CONCURRENCY)
+
+    async def open_one(file: UploadFile) -> tuple:
+        async with sem:
+            suffix = os.path.splitext(file.filename)[1]
+            hasher = hashlib.sha256()
+            source = await spools.enter_async_context(upload_source(file, suffix=suffix, hasher=hasher))
+            return source, suffix, hasher.hexdigest()
+
+    return await asyncio.gather(*(open_one(f) for f in files), return_exceptions=True)
+
+
+async def _batch_results(
+    names: List[str],
+    sources: List[Any],
+    manual_per_file: Tuple[Any, ...],
+    no_cache: bool,
+    verbose: bool,
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(index, result)`` for each file as soon as its outcome is known."""
+    # Files are independent; bound how many are in OCR/upload at once
+    sem = asyncio.Semaphore(MOSIP_CONCURRENCY)
+
+    def error(i: int, err: BaseException) -> Tuple[int, Dict[str, Any]]:
+        return i, {"file": names[i], "status": "error", "error": str(err)}
+
+    async def extract_one(i: int, source: Union[bytes, str], suffix: str, digest: str) -> tuple:
+        async with sem:
+            job = asyncio.ensure_future(_extract_cached(source, suffix, digest, no_cache))
+            try:
+                return i, source, await asyncio.shield(job), None
+            except asyncio.CancelledError:
+                # A pool worker may already be reading the spool; it must finish
+                # before the caller closes it (and its fd number can be reused)
+                await _wait_out([job])
+                raise
+            except Exception as err:
+                return i, source, None, err
+
+    async def upload_one(i: int, pre_reg_id: Optional[str], source: Union[bytes, str]) -> tuple:
+        async with sem:
+            try:
+                return i, pre_reg_id, await _upload_if_registered(pre_reg_id, source, names[i]), None
+            except Exception as err:
+                return i, pre_reg_id, None, err
+
+    # Tasks are owned here so an early stop (e.g. client disconnect) can reap them
+    tasks: List[asyncio.Task] = []
+    try:
+        ocr_jobs = []
+        for i, prepared in enumerate(sources):
+            if not isinstance(prepared, BaseException):
+                ocr_jobs.append(asyncio.create_task(extract_one(i, *prepared)))
+        tasks += ocr_jobs
+        for i, prepared in enumerate(sources):
+            if isinstance(prepared, BaseException):
+                yield error(i, prepared)
+
+        # (index, source, extracted_data) for files that made it through OCR
+        extracted: List[tuple] = []
+        for job in asyncio.as_completed(ocr_jobs):
+            i, source, extracted_data, err = await job
+            if err is not None:
+                yield error(i, err)
+            else:
+                extracted.append((i, source, extracted_data))
+        if not extracted:
+            return
+
+        # One pre-registration round trip for the whole batch, then parallel uploads
+        try:
+            batch_response = await _call_mosip(
+                mosip_client.create_pre_registration_batch,
+                [{"raw_text": extracted_data} for _, _, extracted_data in extracted],
+            )
+            pre_reg_ids = [r.get("preRegistrationId") for r in batch_response.get("response", [])]
+            pre_reg_ids += [None] * (len(extracted) - len(pre_reg_ids))
+        except Exception as e:
+            for i, _, _ in extracted:
+                yield error(i, e)
+            return
+
+        texts = {i: extracted_data for i, _, extracted_data in extracted}
+        upload_jobs = [
+            asyncio.create_task(upload_one(i, pre_reg_id, source))
+            for (i, source, _), pre_reg_id in zip(extracted, pre_reg_ids)
+        ]
+        tasks += upload_jobs
+        for job in asyncio.as_completed(upload_jobs):
+            i, pre_reg_id, upload_response, err = await job
+            if err is not None:
+                yield error(i, err)
+                continue
+            result = {
+                "file": names[i],
+                "status": "success",
+                "pre_registration_id": pre_reg_id,
+                "extracted_data": texts[i],
+                "manual_data": manual_per_file[i],
+                "upload": upload_response,
+            }
+            if pre_reg_id:
+                _remember(pre_reg_id, result)
+            yield i, (result if verbose else {k: v for k, v in result.items() if k not in _ECHO_KEYS})
+    finally:
+        # No job may outlive the sources it reads, however iteration ends
+        for task in tasks:
+            task.cancel()
+        await _wait_out(tasks)
+
+
+class _SpooledStreamingResponse(StreamingResponse):
+    """StreamingResponse that releases its upload spools however the response ends.
+
+    Starlette only runs ``background`` after a fully sent body; this closes the
+    body iterator and then the spools even if sending fails or never starts.
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], spools: AsyncExitStack, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self._spools = spools
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                # Reap in-flight OCR/upload jobs before their sources go away
+                await self.body_iterator.aclose()
+            finally:
+                await self._spools.aclose()
+
+
+def _batch_summary(batch_id: str, total: int, successful: int) -> Dict[str, Any]:
+    return {"batch_id": batch_id, "total_files": total, "successful": successful, "failed": total - successful}
+
+
 @router.post("/batch-submit", summary="Submit multiple documents to MOSIP")
 async def batch_submit_to_mosip(
     files: List[UploadFile] = File(..., description="Multiple documents to process"),
     verification_data: Optional[str] = Form(None, description="JSON array of verification data"),
+    verbose: bool = Form(False, description="Echo extracted text and upload responses per file"),
+    no_cache: bool = Query(False, description="Force OCR even for previously seen documents"),
+    stream: bool = Query(False, description="Stream one NDJSON line per file as it completes"),
 ):
-    results = []
-    verification_list = []
+    verification_list: Tuple[Any, ...] = ()
     if verification_data:
         try:
-            verification_list = json.loads(verification_data)
-        except json.JSONDecodeError:
+            verification_list = _parse_verification_data(verification_data)
+        except ValueError:
             raise HTTPException(status_code=400, detail="Invalid verification_data JSON")
-
-    for i, file in enumerate(files):
+    # One manual-data slot per file, so lookups below need no bounds check
+    manual_per_file = verification_list[:len(files)] + (None,) * (len(files) - len(verification_list))
+    names = [f.filename for f in files]
+    batch_id = f"batch_{os.urandom(4).hex()}"
+
+    if stream:
+        # Sources must be copied before returning: the upload handles don't outlive this call
+        spools = AsyncExitStack()
         try:
-            manual_data = verification_list[i] if i < len(verification_list) else None
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-                content = await file.read()
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
-
-            extracted_data = extract_text(tmp_path)
-            pre_reg_response = mosip_client.create_pre_registration({"raw_text": extracted_data})
-            pre_reg_id = pre_reg_response.get("response", {}).get("preRegistrationId")
-            upload_response = mosip_client.upload_document(pre_reg_id, tmp_path) if pre_reg_id else {}
-            os.unlink(tmp_path)
-
-            results.append(
-                {
-                    "file": file.filename,
-                    "status": "success",
-                    "pre_registration_id": pre_reg_id,
-                    "extracted_data": extracted_data,
-                    "manual_data": manual_data,
-                    "upload": upload_response,
-                }
-            )
-        except Exception as e:
-            results.append({"file": file.filename, "status": "error", "error": str(e)})
-
-    return {
-        "batch_id": f"batch_{os.urandom(4).hex()}",
-        "total_files": len(files),
-        "successful": sum(1 for r in results if r["status"] == "success"),
-        "failed": sum(1 for r in results if r["status"] == "error"),
-        "results": results,
-    }
+            sources = await _open_batch_sources(files, spools)
+        except BaseException:
+            await spools.aclose()
+            raise
+
+        async def ndjson() -> AsyncIterator[bytes]:
+            successful = 0
+            # aclosing: an early exit must reap _batch_results' jobs, not leave it to GC
+            async with aclosing(_batch_results(names, sources, manual_per_file, no_cache, verbose)) as batch:
+                async for i, result in batch:
+                    if result["status"] == "success":
+                        successful += 1
+                    yield orjson.dumps({"index": i, **result}) + b"\n"
+            yield orjson.dumps({"summary": _batch_summary(batch_id, len(files), successful)}) + b"\n"
+
+        # The response owns the spools from here and closes them after the body
+        return _SpooledStreamingResponse(ndjson(), spools, media_type="application/x-ndjson")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+    # Sources stay open until the uploads have read them
+    async with AsyncExitStack() as spools:
+        sources = await _open_batch_sources(files, spools)
+        async with aclosing(_batch_results(names, sources, manual_per_file, no_cache, verbose)) as batch:
+            async for i, result in batch:
+                results[i] = result
+
+    successful = sum(1 for r in results if r["status"] == "success")
+    return {**_batch_summary(batch_id, len(files), successful), "results": results}
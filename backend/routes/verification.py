@@ -9,12 +9,15 @@ Thin API layer that:
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
-import json
-from datetime import datetime
+import orjson
+from datetime import date, datetime
 import os
+from types import MappingProxyType
 
 # Import your core verification logic (make sure path is correct)
 # core/verifier.py must expose: aggregate_confidence, decision_from_confidence
@@ -63,19 +66,57 @@ COMMON_KEY_MAP = {
     "birth_date": "dob",
     
 }
+# Read-only view for lookups, plus the alias set for the no-rename fast path
+_KEY_MAP = MappingProxyType(COMMON_KEY_MAP)
+_ALIAS_KEYS = frozenset(COMMON_KEY_MAP)
 
 def map_input_keys(d: Dict[str, Any]) -> Dict[str, Any]:
     """
     Map alternative keys to canonical keys expected by core.verifier.
     Leaves unknown keys as-is (so forward-compatible).
+    Input without any alias keys is returned as-is, not copied.
     """
     if not d:
         return {}
-    out = {}
-    for k, v in d.items():
-        canonical = COMMON_KEY_MAP.get(k, k)
-        out[canonical] = v
-    return out
+    if d.keys().isdisjoint(_ALIAS_KEYS):
+        return d
+    return {_KEY_MAP.get(k, k): v for k, v in d.items()}
+
+# ----------------------------
+# DOB parsing for the age-consistency note
+# '/' separators are folded to '-' once, so only dash formats are listed
+# ----------------------------
+_DOB_FMTS = ("%d-%m-%Y", "%Y-%m-%d", "%d-%m-%y")
+
+def _fast_parse(s: str) -> Optional[date]:
+    """
+    Slice-and-int parse for the common dd-mm-yyyy and yyyy-mm-dd shapes,
+    skipping strptime. None means "not this shape"; callers fall back.
+    """
+    if len(s) != 10 or not s.isascii():
+        return None
+    try:
+        if s[2] == '-' and s[5] == '-' and s[:2].isdigit() and s[3:5].isdigit() and s[6:].isdigit():
+            return date(int(s[6:]), int(s[3:5]), int(s[:2]))
+        if s[4] == '-' and s[7] == '-' and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit():
+            return date(int(s[:4]), int(s[5:7]), int(s[8:]))
+    except ValueError:
+        # Right shape but not a real date (e.g. 31-02-2001)
+        return None
+    return None
+
+def parse_dob(value: Any) -> Optional[date]:
+    """Parse a DOB string in one of the supported formats; None if none match."""
+    dob_norm = str(value).strip().replace('/', '-')
+    parsed = _fast_parse(dob_norm)
+    if parsed is not None:
+        return parsed
+    for fmt in _DOB_FMTS:
+        try:
+            return datetime.strptime(dob_norm, fmt).date()
+        except ValueError:
+            continue
+    return None
 
 # ----------------------------
 # Logging helper (append JSONL)
@@ -87,10 +128,67 @@ try:
 except Exception:
     pass
 
+# Entries are handed to a background writer (started from the app lifespan)
+# that appends them in batches, so requests never wait on the log file.
+LOG_QUEUE_MAX = 10_000
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 0.5  # seconds
+_LOG_Q: Optional["asyncio.Queue[str]"] = None
+_LOG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+def _append_lines(lines: List[str]) -> None:
+    try:
+        with open(LOG_FILE, "a", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("\n".join(lines) + "\n")
+    except Exception:
+        logging.exception("Failed to write verification log")
+
+def _enqueue(q: "asyncio.Queue[str]", line: str) -> None:
+    try:
+        q.put_nowait(line)
+    except asyncio.QueueFull:
+        # Shed log entries rather than back-pressure the request path
+        logging.warning("Verification log queue full; dropping entry")
+
+async def run_log_writer() -> None:
+    """
+    Drain queued log entries to LOG_FILE until cancelled.
+    Flushes every LOG_BATCH_SIZE entries or LOG_FLUSH_INTERVAL seconds;
+    whatever is still queued at cancellation is written before returning.
+    """
+    global _LOG_Q, _LOG_LOOP
+    loop = asyncio.get_running_loop()
+    q: "asyncio.Queue[str]" = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+    _LOG_Q, _LOG_LOOP = q, loop
+    batch: List[str] = []
+    try:
+        while True:
+            batch.append(await q.get())
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(q.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Hand the batch off before awaiting so a cancel can't write it twice
+            pending, batch = batch, []
+            await asyncio.to_thread(_append_lines, pending)
+    finally:
+        _LOG_Q = _LOG_LOOP = None
+        while not q.empty():
+            batch.append(q.get_nowait())
+        if batch:
+            _append_lines(batch)
+
 def log_request(ocr: Dict[str, Any], user: Dict[str, Any], response: Dict[str, Any]) -> None:
     """
-    Append JSONL entry with timestamp, raw ocr, user, and response.
-    Use ensure_ascii=False to keep unicode (Hindi) readable.
+    Queue a JSONL entry with timestamp, raw ocr, user, and response.
+    orjson emits UTF-8 directly, so unicode (Hindi) stays readable.
+    Safe to call from worker threads; without a running writer the entry
+    is appended synchronously.
     """
     try:
         entry = {
@@ -99,9 +197,12 @@ def log_request(ocr: Dict[str, Any], user: Dict[str, Any], response: Dict[str, A
             "user": user,
             "response": response
         }
-        # open in append mode
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        line = orjson.dumps(entry).decode()
+        q, loop = _LOG_Q, _LOG_LOOP
+        if q is None or loop is None:
+            _append_lines([line])
+        else:
+            loop.call_soon_threadsafe(_enqueue, q, line)
     except Exception:
         logging.exception("Failed to write verification log")
 
@@ -109,7 +210,7 @@ def log_request(ocr: Dict[str, Any], user: Dict[str, Any], response: Dict[str, A
 # Main endpoint
 # ----------------------------
 @router.post("/verify", response_model=VerifyResponse)
-def verify_endpoint(req: VerifyRequest):
+async def verify_endpoint(req: VerifyRequest):
     """
     POST /verification/verify
     Body: VerifyRequest
@@ -123,19 +224,15 @@ def verify_endpoint(req: VerifyRequest):
 
         # Call core A3 logic (pure functions)
         # Pass weights only if provided; aggregate_confidence expects a dict or defaults internally
-        final_score, field_scores, notes = aggregate_confidence(ocr, user, weights if weights else None)
+        # Fuzzy scoring is CPU-bound: keep it off the event loop, the rest stays on it
+        final_score, field_scores, notes = await run_in_threadpool(
+            aggregate_confidence, ocr, user, weights if weights else None
+        )
 
         # Optional age consistency note (mirror map-and-verify behavior)
         # Age does not affect scoring; purely informational.
         if ocr.get("dob") and ocr.get("age"):
-            dob_norm = str(ocr["dob"]).strip()
-            parsed = None
-            for fmt in ("%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%d-%m-%y", "%d/%m/%y"):
-                try:
-                    parsed = datetime.strptime(dob_norm.replace('/', '-'), fmt.replace('/', '-')).date()
-                    break
-                except Exception:
-                    continue
+            parsed = parse_dob(ocr["dob"])
             if parsed:
                 today = datetime.utcnow().date()
                 derived_age = int((today - parsed).days / 365.25)
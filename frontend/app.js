@@ -12,6 +12,7 @@ const ENDPOINTS = {
         integrate: `${BASE_URL}/api/v1/mosip/integrate`,
         verifyAndSubmit: `${BASE_URL}/api/v1/mosip/verify-and-submit`,
         status: `${BASE_URL}/api/v1/mosip/status`,
+        results: `${BASE_URL}/api/v1/mosip/results`,
         test: `${BASE_URL}/api/v1/mosip/test`,
         batchSubmit: `${BASE_URL}/api/v1/mosip/batch-submit`
     }
@@ -833,7 +834,7 @@ async function submitToMOSIP() {
                 </div>
                 <div class="mt-3 d-flex gap-2">
                     <button class="btn btn-outline-primary" onclick="checkMOSIPStatus('${preRegId}')">Check Status</button>
-                    <button class="btn btn-outline-secondary" onclick='downloadMOSIPReport(${JSON.stringify(result)})'>Download Registration Report</button>
+                    <button class="btn btn-outline-secondary" onclick="downloadMOSIPReport('${preRegId}')">Download Registration Report</button>
                 </div>
             `;
         }
@@ -909,8 +910,29 @@ async function checkMOSIPStatus(preRegId) {
     }
 }
 
-function downloadMOSIPReport(result) {
+// The compact /integrate response saved at submission, if it is for this ID
+function savedMOSIPResponse(preRegId) {
     try {
+        const saved = JSON.parse(localStorage.getItem('last_mosip_response') || 'null');
+        return saved && saved.pre_registration_id === preRegId ? saved : null;
+    } catch (_) {
+        return null;
+    }
+}
+
+async function downloadMOSIPReport(preRegId) {
+    try {
+        // Submission responses are compact; the full record lives on the server
+        const resp = await fetch(`${ENDPOINTS.mosip.results}/${preRegId}`);
+        let result = await resp.json().catch(() => ({}));
+        if (resp.status === 404) {
+            // The server only keeps recent results in memory (lost on restart or
+            // eviction, not shared across workers); fall back to what we got at submission
+            result = savedMOSIPResponse(preRegId) || result;
+            if (!result.pre_registration_id) throw new Error(result.detail || 'Report not available');
+        } else if (!resp.ok) {
+            throw new Error(result.detail || 'Report not available');
+        }
         const dataStr = "data:text/json;charset=utf-8," + encodeURIComponent(JSON.stringify(result, null, 2));
         const a = document.createElement('a');
         a.setAttribute('href', dataStr);
@@ -1,5 +1,15 @@
 import sys, os
+import pytest
 # Ensure project root (containing `backend`) is on sys.path for tests.
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run; entering it runs the app lifespan once."""
+    from fastapi.testclient import TestClient
+    from backend.app import app
+    with TestClient(app) as c:
+        yield c
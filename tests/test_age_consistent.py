@@ -1,12 +1,9 @@
-from datetime import datetime, date
-from fastapi.testclient import TestClient
-from backend.app import app
-
-client = TestClient(app)
+from datetime import date
+from backend.routes.verification import parse_dob
 
 DOB_STR = "19/04/2001"
 # Derive age with same logic as route (int of days/365.25)
-parsed = datetime.strptime(DOB_STR.replace('/', '-'), "%d-%m-%Y").date()
+parsed = parse_dob(DOB_STR)
 derived_age = int((date.today() - parsed).days / 365.25)
 
 SAMPLE_TEXT_TEMPLATE = """
@@ -29,7 +26,7 @@ USER = {
     "gender": "male"
 }
 
-def test_age_consistent_no_mismatch():
+def test_age_consistent_no_mismatch(client):
     resp = client.post("/api/v1/map-and-verify", json={"raw_text": SAMPLE_TEXT, "user": USER})
     assert resp.status_code == 200, resp.text
     data = resp.json()
@@ -1,8 +1,5 @@
-from datetime import datetime, date
-from fastapi.testclient import TestClient
-from backend.app import app
-
-client = TestClient(app)
+from datetime import date
+from backend.routes.verification import parse_dob
 
 SAMPLE_TEXT_MISMATCH = """
 Name: Ramesh Kumar
@@ -16,7 +13,7 @@ Email: ramesh.kumar@example.com
 
 # Build consistent sample dynamically to avoid future age drift
 DOB_STR = "19/04/2001"
-parsed = datetime.strptime(DOB_STR.replace('/', '-'), "%d-%m-%Y").date()
+parsed = parse_dob(DOB_STR)
 derived_age = int((date.today() - parsed).days / 365.25)
 SAMPLE_TEXT_CONSISTENT = f"""
 Name: Ramesh Kumar
@@ -36,7 +33,7 @@ USER = {
     "gender": "male"
 }
 
-def test_age_mismatch_note():
+def test_age_mismatch_note(client):
     resp = client.post("/api/v1/map-and-verify", json={"raw_text": SAMPLE_TEXT_MISMATCH, "user": USER})
     assert resp.status_code == 200, resp.text
     data = resp.json()
@@ -47,7 +44,7 @@ def test_age_mismatch_note():
     assert "overall_confidence" in data["verification"]
     assert "age" in data["mapped"]
 
-def test_age_consistent_no_mismatch():
+def test_age_consistent_no_mismatch(client):
     resp = client.post("/api/v1/map-and-verify", json={"raw_text": SAMPLE_TEXT_CONSISTENT, "user": {
         "name": USER["name"],
         "dob": USER["dob"],
@@ -0,0 +1,332 @@
+import asyncio
+import json
+
+import anyio
+import pytest
+
+from backend.core import ocr_cache
+from backend.routes import mosip
+
+
+RAW_TEXT = """
+Name: Ramesh Kumar
+DOB: 19/04/2001
+Gender: Male
+"""
+
+
+@pytest.fixture(autouse=True)
+def fake_ocr(monkeypatch, tmp_path):
+    # OCR models are not needed to exercise the MOSIP flow
+    async def extract_text(path, suffix=None):
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", extract_text)
+    monkeypatch.setattr(ocr_cache, "OCR_CACHE_DIR", tmp_path / "ocr_cache")
+
+
+def integrate(client, manual_data=None):
+    data = {}
+    if manual_data is not None:
+        data["manual_data"] = json.dumps(manual_data)
+    return client.post(
+        "/api/v1/mosip/integrate",
+        files={"file": ("doc.png", b"fake-image-bytes", "image/png")},
+        data=data,
+    )
+
+
+def test_integrate_skips_verification_without_overlap(client):
+    resp = integrate(client, {"Address": "12 Gandhi Road"})
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["status"] == "success"
+    assert data["verification_results"] == {"status": "skipped", "reason": "no_overlap_fields"}
+
+
+def test_integrate_ignores_empty_manual_values_for_overlap(client):
+    resp = integrate(client, {"Name": "", "Address": "12 Gandhi Road"})
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["verification_results"]["status"] == "skipped"
+
+
+def test_integrate_verifies_overlapping_fields(client):
+    resp = integrate(client, {"Name": "Ramesh Kumar", "Gender": "male"})
+    assert resp.status_code == 200, resp.text
+    ver = resp.json()["verification_results"]
+    assert set(ver["fields"]) >= {"name", "gender"}
+    assert ver["decision"] == "MATCH"
+
+
+def test_integrate_compact_response_with_full_result_lookup(client):
+    resp = integrate(client, {"Name": "Ramesh Kumar"})
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert "extracted_data" not in data and "pre_registration_response" not in data
+    pre_reg_id = data["pre_registration_id"]
+
+    full = client.get(f"/api/v1/mosip/results/{pre_reg_id}")
+    assert full.status_code == 200
+    assert full.json()["extracted_data"] == RAW_TEXT
+    assert client.get("/api/v1/mosip/results/PRE_UNKNOWN").status_code == 404
+
+
+def test_integrate_verbose_echoes_payloads(client):
+    resp = client.post(
+        "/api/v1/mosip/integrate",
+        files={"file": ("doc.png", b"fake-image-bytes", "image/png")},
+        data={"verbose": "true"},
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["extracted_data"] == RAW_TEXT
+    assert data["document_upload_response"]["status"] == "uploaded"
+    assert data["document_upload_response"]["file"] == "doc.png"
+
+
+def test_batch_submit_preserves_order_and_reports_counts(client):
+    files = [("files", (f"doc{i}.png", b"fake-image-bytes", "image/png")) for i in range(3)]
+    resp = client.post(
+        "/api/v1/mosip/batch-submit",
+        files=files,
+        data={"verification_data": json.dumps([{"Name": "Ramesh Kumar"}])},
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["total_files"] == 3
+    assert data["successful"] == 3 and data["failed"] == 0
+    assert [r["file"] for r in data["results"]] == ["doc0.png", "doc1.png", "doc2.png"]
+    ids = [r["pre_registration_id"] for r in data["results"]]
+    assert all(ids) and len(set(ids)) == 3
+    assert data["results"][0]["manual_data"] == {"Name": "Ramesh Kumar"}
+    assert data["results"][1]["manual_data"] is None
+
+
+def test_batch_submit_rejects_non_array_verification_data(client):
+    resp = client.post(
+        "/api/v1/mosip/batch-submit",
+        files=[("files", ("doc.png", b"fake-image-bytes", "image/png"))],
+        data={"verification_data": json.dumps({"Name": "Ramesh Kumar"})},
+    )
+    assert resp.status_code == 400
+
+
+def test_batch_submit_reports_failed_file_in_place(client, monkeypatch):
+    async def flaky_extract(path, suffix=None):
+        if suffix == ".pdf":
+            raise ValueError("unreadable document")
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", flaky_extract)
+
+    files = [
+        ("files", ("a.png", b"img", "image/png")),
+        ("files", ("b.pdf", b"pdf", "application/pdf")),
+        ("files", ("c.png", b"img", "image/png")),
+    ]
+    resp = client.post("/api/v1/mosip/batch-submit", files=files)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["successful"] == 2 and data["failed"] == 1
+    assert [r["status"] for r in data["results"]] == ["success", "error", "success"]
+    assert data["results"][1]["error"] == "unreadable document"
+
+
+def test_integrate_reuses_cached_ocr_for_identical_document(client, monkeypatch):
+    calls = []
+
+    async def counting_extract(path, suffix=None):
+        calls.append(path)
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", counting_extract)
+
+    assert integrate(client).status_code == 200
+    assert integrate(client).status_code == 200
+    assert len(calls) == 1
+
+    resp = client.post(
+        "/api/v1/mosip/integrate?no_cache=true",
+        files={"file": ("doc.png", b"fake-image-bytes", "image/png")},
+    )
+    assert resp.status_code == 200
+    assert len(calls) == 2
+
+
+def test_batch_submit_streams_ndjson(client, monkeypatch):
+    async def flaky_extract(path, suffix=None):
+        if suffix == ".pdf":
+            raise ValueError("unreadable document")
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", flaky_extract)
+
+    files = [
+        ("files", ("a.png", b"img-a", "image/png")),
+        ("files", ("b.pdf", b"pdf", "application/pdf")),
+        ("files", ("c.png", b"img-c", "image/png")),
+    ]
+    resp = client.post("/api/v1/mosip/batch-submit?stream=true", files=files)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    *items, last = lines
+    assert sorted(item["index"] for item in items) == [0, 1, 2]
+    by_index = {item["index"]: item for item in items}
+    assert by_index[1]["status"] == "error" and by_index[0]["status"] == "success"
+    assert last["summary"]["total_files"] == 3
+    assert last["summary"]["successful"] == 2 and last["summary"]["failed"] == 1
+
+
+def test_parse_verification_data():
+    raw = json.dumps([{"Name": "Ramesh Kumar"}, None])
+    assert mosip._parse_verification_data(raw) == ({"Name": "Ramesh Kumar"}, None)
+    with pytest.raises(ValueError):
+        mosip._parse_verification_data('{"Name": "Ramesh Kumar"}')
+
+
+def test_batch_results_reaps_jobs_when_closed_early(monkeypatch):
+    monkeypatch.setattr(mosip, "MOSIP_CONCURRENCY", 2)
+    started, finished = [], []
+
+    async def slow_extract(source, suffix=None):
+        started.append(source)
+        await asyncio.sleep(0.05)
+        finished.append(source)
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", slow_extract)
+
+    sources = [ValueError("unreadable")] + [(f"doc-{i}".encode(), ".png", f"digest-{i}") for i in range(6)]
+    names = [f"f{i}.png" for i in range(len(sources))]
+
+    async def run():
+        batch = mosip._batch_results(names, sources, (None,) * len(sources), True, False)
+        i, first = await batch.__anext__()
+        assert (i, first["status"]) == (0, "error")
+        await asyncio.sleep(0.01)  # let the first OCR jobs start
+        await batch.aclose()
+        # In-flight jobs finished before aclose returned; nothing else ever starts
+        assert len(started) == 2 and finished == started
+        await asyncio.sleep(0.1)
+        assert len(started) == 2
+
+    asyncio.run(run())
+
+
+def test_batch_results_waits_for_reads_when_stream_cancelled(monkeypatch):
+    # Starlette cancels a disconnected stream through an anyio cancel scope
+    monkeypatch.setattr(mosip, "MOSIP_CONCURRENCY", 2)
+    started, finished = [], []
+
+    async def slow_extract(source, suffix=None):
+        started.append(source)
+        await asyncio.sleep(0.05)
+        finished.append(source)
+        return RAW_TEXT
+    monkeypatch.setattr(mosip, "extract_text", slow_extract)
+
+    sources = [(f"doc-{i}".encode(), ".png", f"digest-{i}") for i in range(6)]
+    names = [f"f{i}.png" for i in range(len(sources))]
+
+    async def consume():
+        batch = mosip._batch_results(names, sources, (None,) * len(sources), True, False)
+        async with mosip.aclosing(batch):
+            async for _ in batch:
+                pass
+
+    async def run():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(consume)
+            await asyncio.sleep(0.01)  # let the first OCR jobs start
+            tg.cancel_scope.cancel()
+        # The consumer only exits once the started reads are done
+        assert len(started) == 2 and finished == started
+        await asyncio.sleep(0.1)
+        assert len(started) == 2
+
+    asyncio.run(run())
+
+
+def test_streaming_response_closes_spools_when_send_fails():
+    closed = []
+
+    async def body():
+        yield b"never sent\n"
+
+    async def run():
+        spools = mosip.AsyncExitStack()
+        spools.callback(closed.append, True)
+        response = mosip._SpooledStreamingResponse(body(), spools, media_type="application/x-ndjson")
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError):
+            await response({"type": "http"}, receive, send)
+
+    asyncio.run(run())
+    assert closed == [True]
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_call_mosip_retries_transient_errors():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise FakeHTTPError(503)
+        return "ok"
+
+    assert asyncio.run(mosip._call_mosip(flaky, base=0)) == "ok"
+    assert len(attempts) == 3
+
+
+def test_call_mosip_slots_work_across_event_loops(monkeypatch):
+    # Fill the cap so acquiring contends; a loop-bound semaphore fails on the second loop
+    monkeypatch.setattr(mosip, "MOSIP_MAX_INFLIGHT", 1)
+
+    async def call_twice():
+        async def ok():
+            await asyncio.sleep(0)
+            return "ok"
+        return await asyncio.gather(mosip._call_mosip(ok), mosip._call_mosip(ok))
+
+    assert asyncio.run(call_twice()) == ["ok", "ok"]
+    assert asyncio.run(call_twice()) == ["ok", "ok"]
+
+
+def test_call_mosip_does_not_retry_client_errors():
+    attempts = []
+
+    async def bad_request():
+        attempts.append(1)
+        raise FakeHTTPError(400)
+
+    with pytest.raises(FakeHTTPError):
+        asyncio.run(mosip._call_mosip(bad_request, base=0))
+    assert len(attempts) == 1
+
+
+def test_passes_verification_thresholds():
+    assert mosip._passes_verification({})
+    assert mosip._passes_verification({"overall_confidence": 0.9})
+    assert not mosip._passes_verification({"overall_confidence": 0.5})
+    assert mosip._passes_verification({"fields": {"name": 0.9, "dob": 1}})
+    assert not mosip._passes_verification({"fields": {"name": 0.9, "dob": 0.2}})
+    # Non-numeric entries are ignored, and none at all passes
+    assert mosip._passes_verification({"fields": {"note": "n/a"}})
+
+
+def test_passes_verification_large_field_maps():
+    fields = {f"f{i}": 0.9 for i in range(20)}
+    fields["remark"] = "ok"
+    assert mosip._passes_verification({"fields": fields})
+    assert not mosip._passes_verification({"fields": {**fields, "f3": 0.1}})
+    assert mosip._passes_verification({"fields": {f"n{i}": "x" for i in range(20)}})
+    # A score exactly at the threshold passes, however many fields there are
+    assert mosip._passes_verification({"fields": {**fields, "f3": 0.85}})
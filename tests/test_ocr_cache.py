@@ -0,0 +1,46 @@
+import os
+import stat
+
+import pytest
+
+from backend.core import ocr_cache
+
+
+def test_cache_dir_created_private_and_round_trips(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "ocr_cache"
+    monkeypatch.setattr(ocr_cache, "OCR_CACHE_DIR", cache_dir)
+    ocr_cache.put("abc.png", "Name: Ramesh")
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert ocr_cache.get("abc.png") == "Name: Ramesh"
+
+
+def test_shared_cache_dir_is_bypassed(monkeypatch, tmp_path):
+    # e.g. pre-created world-writable by another local user, with a planted entry
+    cache_dir = tmp_path / "ocr_cache"
+    cache_dir.mkdir()
+    os.chmod(cache_dir, 0o777)
+    (cache_dir / "abc.png.json").write_bytes(b'{"text": "planted"}')
+    monkeypatch.setattr(ocr_cache, "OCR_CACHE_DIR", cache_dir)
+    assert ocr_cache.get("abc.png") is None
+    ocr_cache.put("def.png", "Name: Ramesh")
+    assert not (cache_dir / "def.png.json").exists()
+
+
+def test_symlinked_cache_dir_is_bypassed(monkeypatch, tmp_path):
+    target = tmp_path / "elsewhere"
+    target.mkdir(mode=0o700)
+    (target / "abc.png.json").write_bytes(b'{"text": "planted"}')
+    link = tmp_path / "ocr_cache"
+    link.symlink_to(target)
+    monkeypatch.setattr(ocr_cache, "OCR_CACHE_DIR", link)
+    assert ocr_cache.get("abc.png") is None
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+def test_cache_dir_owned_by_other_user_is_bypassed(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "ocr_cache"
+    cache_dir.mkdir(mode=0o700)
+    (cache_dir / "abc.png.json").write_bytes(b'{"text": "planted"}')
+    os.chown(cache_dir, 12345, 12345)
+    monkeypatch.setattr(ocr_cache, "OCR_CACHE_DIR", cache_dir)
+    assert ocr_cache.get("abc.png") is None
@@ -0,0 +1,14 @@
+from backend.core import ocr_pool
+
+
+def test_pool_recreated_after_shutdown():
+    # No job is submitted, so no worker process (or OCR model) is started
+    first = ocr_pool._get_pool()
+    assert ocr_pool._get_pool() is first
+    ocr_pool.shutdown()
+    second = ocr_pool._get_pool()
+    assert second is not first
+    # The fresh pool accepts work again; the old one would raise "after shutdown"
+    assert not second._shutdown_thread
+    ocr_pool.shutdown()
+    ocr_pool.shutdown()  # idempotent without a live pool
@@ -0,0 +1,40 @@
+import fitz
+
+from backend.core import ocr
+
+LINES = [
+    "Name: Ramesh Kumar",
+    "DOB: 19/04/2001",
+    "Gender: Male",
+    "Address: B12/3 Gandhi Street MG Road",
+]
+
+
+def make_pdf(lines):
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, line in enumerate(lines):
+        page.insert_text((72, 72 + 18 * i), line)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_text_native_pdf_skips_ocr(monkeypatch):
+    def no_ocr(*args, **kwargs):
+        raise AssertionError("OCR should not run for a text-native page")
+    monkeypatch.setattr(ocr, "_predict_texts", no_ocr)
+
+    text = ocr.extract_from_pdf_bytes(make_pdf(LINES), min_text_chars=20)
+    assert text.startswith("--- PAGE 1 ---")
+    assert "Gender: Male" in text
+    assert "DOB: 19/04/2001" in text
+
+
+def test_sparse_text_layer_falls_back_to_ocr(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ocr, "_predict_texts", lambda img, lang="en": calls.append(img.shape) or "ocr text")
+
+    text = ocr.extract_from_pdf_bytes(make_pdf(["x"]), zoom=1.0)
+    assert calls
+    assert text == "--- PAGE 1 ---\nocr text"
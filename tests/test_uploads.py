@@ -0,0 +1,96 @@
+import asyncio
+import io
+import os
+from types import SimpleNamespace
+
+import cv2 as cv
+import numpy as np
+
+from backend.core import ocr, uploads
+
+
+def fake_upload(payload):
+    return SimpleNamespace(file=io.BytesIO(payload))
+
+
+def test_spooled_upload_file_round_trip_and_cleanup():
+    async def run():
+        async with uploads.spooled_upload_file(fake_upload(b"%PDF-1.4 sample"), suffix=".pdf") as path:
+            with open(path, "rb") as f:
+                return path, f.read()
+
+    path, data = asyncio.run(run())
+    assert data == b"%PDF-1.4 sample"
+    assert not os.path.exists(path)
+
+
+def test_spooled_upload_file_cleans_up_on_error():
+    seen = []
+
+    async def run():
+        async with uploads.spooled_upload_file(fake_upload(b"data"), suffix=".png") as path:
+            seen.append(path)
+            raise RuntimeError("boom")
+
+    try:
+        asyncio.run(run())
+    except RuntimeError:
+        pass
+    assert not os.path.exists(seen[0])
+
+
+def test_spooled_upload_file_copies_in_chunks(monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 4)
+    monkeypatch.setattr(uploads, "_BUF_POOL", uploads.queue.LifoQueue(maxsize=2))
+    payload = b"0123456789abcdef-tail"
+    upload = fake_upload(payload)
+
+    async def run():
+        async with uploads.spooled_upload_file(upload, suffix=".pdf") as path:
+            with open(path, "rb") as f:
+                return f.read()
+
+    assert asyncio.run(run()) == payload
+    # The copy buffer went back to the pool for the next upload
+    assert uploads._BUF_POOL.qsize() == 1
+
+
+class FakeUpload:
+    def __init__(self, payload):
+        self.file = io.BytesIO(payload)
+        self.size = len(payload)
+
+    async def read(self):
+        return self.file.read()
+
+
+def test_upload_source_keeps_small_uploads_in_memory(monkeypatch):
+    monkeypatch.setattr(uploads, "INLINE_MAX", 8)
+
+    async def run(payload):
+        async with uploads.upload_source(FakeUpload(payload), suffix=".png") as source:
+            with uploads.open_source(source) as f:
+                return source, f.read()
+
+    source, data = asyncio.run(run(b"tiny"))
+    assert source == b"tiny" and data == b"tiny"
+
+    source, data = asyncio.run(run(b"larger than eight"))
+    assert isinstance(source, str) and data == b"larger than eight"
+
+
+def test_extensionless_upload_detected_alike_in_memory_and_spooled(monkeypatch):
+    shapes = []
+    monkeypatch.setattr(ocr, "_predict_texts", lambda img, lang="en": shapes.append(img.shape) or "text")
+    ok, png = cv.imencode(".png", np.zeros((12, 16, 3), dtype=np.uint8))
+    assert ok
+
+    async def run(inline_max):
+        monkeypatch.setattr(uploads, "INLINE_MAX", inline_max)
+        async with uploads.upload_source(FakeUpload(png.tobytes())) as source:
+            return type(source), ocr.process_input(source)
+
+    # Small uploads stay in memory, larger ones are spooled to a path
+    assert asyncio.run(run(1 << 20)) == (bytes, "text")
+    assert asyncio.run(run(0)) == (str, "text")
+    assert shapes == [(12, 16, 3), (12, 16, 3)]
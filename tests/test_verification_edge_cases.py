@@ -1,7 +1,4 @@
-from fastapi.testclient import TestClient
-from backend.app import app
-
-client = TestClient(app)
+import pytest
 
 USER = {
     "name": "Ramesh Kumar",
@@ -13,11 +10,25 @@ USER = {
 
 # Helper
 
-def mv(raw_text: str, user: dict = USER):
+def mv(client, raw_text: str, user: dict = USER):
     resp = client.post("/api/v1/map-and-verify", json={"raw_text": raw_text, "user": user})
     assert resp.status_code == 200, resp.text
     return resp.json()["verification"], resp.json()["mapped"]
 
+# Clean document matching USER; the typo and missing-number tests compare against it
+RAW_BASELINE = """
+Name: Ramesh Kumar
+DOB: 19/04/2001
+Gender: Male
+Address: B12/3 Gandhi Street MG Road
+Phone: +91 98765-43210
+"""
+
+@pytest.fixture(scope="module")
+def baseline_ver(client):
+    ver, _ = mv(client, RAW_BASELINE)
+    return ver
+
 # 1. Name order invariance
 RAW_NAME_ORDER = """
 Name: Kumar Ramesh
@@ -27,8 +38,8 @@ Address: B12/3 Gandhi Street MG Road
 Phone: +91 98765-43210
 """
 
-def test_name_order_invariance():
-    ver, _ = mv(RAW_NAME_ORDER)
+def test_name_order_invariance(client):
+    ver, _ = mv(client, RAW_NAME_ORDER)
     assert ver["fields"]["name"] >= 0.9, ver["fields"]["name"]
 
 # 2. Minor name typo reduces score but stays reasonably high
@@ -40,10 +51,8 @@ Address: B12/3 Gandhi Street MG Road
 Phone: +91 98765-43210
 """
 
-def test_name_minor_typo_decreases_score():
-    # Baseline
-    baseline_ver, _ = mv(RAW_NAME_ORDER.replace("Kumar Ramesh", "Ramesh Kumar"))
-    typo_ver, _ = mv(RAW_NAME_TYPO)
+def test_name_minor_typo_decreases_score(client, baseline_ver):
+    typo_ver, _ = mv(client, RAW_NAME_TYPO)
     base_score = baseline_ver["fields"]["name"]
     typo_score = typo_ver["fields"]["name"]
     assert base_score >= 0.9
@@ -58,8 +67,8 @@ Address: B12/3 Gandhi Street MG Road
 Phone: 76543210
 """
 
-def test_phone_partial_suffix_8_digits():
-    ver, _ = mv(RAW_PHONE_SUFFIX8)
+def test_phone_partial_suffix_8_digits(client):
+    ver, _ = mv(client, RAW_PHONE_SUFFIX8)
     phone_score = ver["fields"]["phone"]
     assert 0.89 <= phone_score <= 0.91, phone_score
 
@@ -72,8 +81,8 @@ Address: B12/3 Gandhi Street MG Road
 Phone: 9876543211
 """
 
-def test_phone_one_digit_difference():
-    ver, _ = mv(RAW_PHONE_ONE_DIGIT_OFF)
+def test_phone_one_digit_difference(client):
+    ver, _ = mv(client, RAW_PHONE_ONE_DIGIT_OFF)
     phone_score = ver["fields"]["phone"]
     assert phone_score < 0.95, phone_score
 
@@ -86,8 +95,8 @@ Address: B12/3 Gandhi St Nr MG Rd
 Phone: +91 98765-43210
 """
 
-def test_address_abbreviation_expansion():
-    ver, _ = mv(RAW_ADDRESS_ABBR)
+def test_address_abbreviation_expansion(client):
+    ver, _ = mv(client, RAW_ADDRESS_ABBR)
     addr_score = ver["fields"]["address"]
     assert addr_score >= 0.8, addr_score  # allow slightly lower due to 'MG' not expanded
 
@@ -100,10 +109,8 @@ Address: Gandhi Street MG Road
 Phone: +91 98765-43210
 """
 
-def test_address_missing_numeric_tokens_lower_score():
-    baseline_raw = RAW_ADDRESS_ABBR.replace("St Nr MG Rd", "Street MG Road")
-    baseline_ver, _ = mv(baseline_raw)
-    missing_ver, _ = mv(RAW_ADDRESS_NO_NUMBER)
+def test_address_missing_numeric_tokens_lower_score(client, baseline_ver):
+    missing_ver, _ = mv(client, RAW_ADDRESS_NO_NUMBER)
     base_score = baseline_ver["fields"]["address"]
     missing_score = missing_ver["fields"]["address"]
     assert base_score >= 0.85
@@ -119,8 +126,8 @@ Address: B12/3 Gandhi Street MG Road
 Phone: +91 98765-43210
 """
 
-def test_dob_format_variant_normalizes():
-    ver, _ = mv(RAW_DOB_VARIANT)
+def test_dob_format_variant_normalizes(client):
+    ver, _ = mv(client, RAW_DOB_VARIANT)
     # After extending DOB regex, variant should match
     assert ver["fields"]["dob"] == 1.0, ver["fields"]["dob"]
 
@@ -133,6 +140,6 @@ Address: B12/3 Gandhi Street MG Road
 Phone: +91 98765-43210
 """
 
-def test_gender_synonym_mapping():
-    ver, _ = mv(RAW_GENDER_SYNONYM)
+def test_gender_synonym_mapping(client):
+    ver, _ = mv(client, RAW_GENDER_SYNONYM)
     assert ver["fields"]["gender"] == 1.0
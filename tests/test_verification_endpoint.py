@@ -1,9 +1,7 @@
-from fastapi.testclient import TestClient
-from backend.app import app
+import time
+from backend.routes import verification
 
-client = TestClient(app)
-
-def test_direct_verify_fields_key():
+def test_direct_verify_fields_key(client):
     payload = {
         "ocr": {
             "name": "Ramesh Kumaar",
@@ -26,3 +24,40 @@ def test_direct_verify_fields_key():
     assert "fields" in data
     assert "field_scores" not in data
     assert set(data["fields"].keys()) >= {"name","dob","phone","address","gender"}
+
+def test_direct_verify_age_note_accepts_dob_formats(client):
+    for dob in ("19/04/2001", "2001-04-19", "19-04-01"):
+        payload = {
+            "ocr": {"name": "Ramesh Kumar", "dob": dob, "age": "5"},
+            "user": {"name": "Ramesh Kumar", "dob": "19-04-2001"},
+        }
+        resp = client.post("/api/v1/verification/verify", json=payload)
+        assert resp.status_code == 200, resp.text
+        assert any(n.startswith("age_mismatch") for n in resp.json()["notes"]), dob
+
+def test_verify_log_entries_written_by_background_writer(client, monkeypatch, tmp_path):
+    log_file = tmp_path / "requests.jsonl"
+    monkeypatch.setattr(verification, "LOG_FILE", str(log_file))
+    marker = "Log Writer Probe"
+    payload = {"ocr": {"name": marker}, "user": {"name": marker}}
+    # The session client runs the lifespan, so the background writer owns the log
+    for _ in range(3):
+        assert client.post("/api/v1/verification/verify", json=payload).status_code == 200
+
+    def written():
+        if not log_file.exists():
+            return 0
+        return log_file.read_text(encoding="utf-8").count(marker)
+
+    deadline = time.monotonic() + 5
+    while written() < 6 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    # Each entry carries the marker twice (ocr and user)
+    assert written() == 6
+
+def test_map_input_keys_aliases_and_passthrough():
+    mapped = verification.map_input_keys({"full_name": "A", "mobile": "1", "city": "X"})
+    assert mapped == {"name": "A", "phone": "1", "city": "X"}
+    canonical = {"name": "A", "dob": "19-04-2001"}
+    assert verification.map_input_keys(canonical) is canonical
+    assert verification.map_input_keys(None) == {}
@@ -1,10 +1,7 @@
-from fastapi.testclient import TestClient
-from backend.app import app
-
-client = TestClient(app)
+import pytest
 
 # Helper to call map-and-verify
-def mv(raw_text: str, user: dict):
+def mv(client, raw_text: str, user: dict):
     resp = client.post("/api/v1/map-and-verify", json={"raw_text": raw_text, "user": user})
     assert resp.status_code == 200, resp.text
     return resp.json()
@@ -41,9 +38,14 @@ Phone: 123456
 Email: random@example.com
 """
 
+# RAW_MATCH backs several tests; map+verify it once per module
+@pytest.fixture(scope="module")
+def match_response(client):
+    return mv(client, RAW_MATCH, USER_BASE)
+
 # 1. All fields should produce high scores and MATCH decision.
-def test_all_fields_match_confidence():
-    data = mv(RAW_MATCH, USER_BASE)
+def test_all_fields_match_confidence(match_response):
+    data = match_response
     ver = data["verification"]
     assert ver["decision"] == "MATCH", ver
     assert ver["overall_confidence"] >= 0.85
@@ -56,20 +58,20 @@ def test_all_fields_match_confidence():
     assert fields["gender"] == 1.0
 
 # 2. Phone normalization: NSN match yields 1.0 or very high.
-def test_phone_suffix_country_code_match():
-    data = mv(RAW_PHONE_COUNTRY, USER_BASE)
+def test_phone_suffix_country_code_match(match_response):
+    data = match_response  # RAW_PHONE_COUNTRY is RAW_MATCH
     phone_score = data["verification"]["fields"]["phone"]
     assert phone_score >= 0.95
 
 # 3. Address numeric bonus should elevate score (expect high >=0.9)
-def test_address_numeric_bonus():
-    data = mv(RAW_ADDRESS_NUMERIC, USER_BASE)
+def test_address_numeric_bonus(match_response):
+    data = match_response  # RAW_ADDRESS_NUMERIC is RAW_MATCH
     addr_score = data["verification"]["fields"]["address"]
     assert addr_score >= 0.9
 
 # 4. Strong mismatches produce low scores and MISMATCH decision; low_score notes present.
-def test_multiple_field_mismatch_notes():
-    data = mv(RAW_FULL_MISMATCH, USER_BASE)
+def test_multiple_field_mismatch_notes(client):
+    data = mv(client, RAW_FULL_MISMATCH, USER_BASE)
     ver = data["verification"]
     assert ver["decision"] == "MISMATCH", ver
     assert ver["overall_confidence"] < 0.6
@@ -0,0 +1,42 @@
+import pytest
+
+from backend.core.verifier import _normalize_full_cached, expand_abbreviations, gender_score, normalize_full
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("Gandhi St.", "gandhi street"),
+        ("MG Rd", "mg road"),
+        ("Nr. Twr Sec 5", "near tower sector 5"),
+        ("Station Rd", "station road"),
+        ("Flat B12, Gandhi St!", "flat b12 gandhi street"),
+        ("मार्ग पास", "road near"),
+        ("", ""),
+    ],
+)
+def test_expand_abbreviations(raw, expected):
+    assert expand_abbreviations(raw) == expected
+
+
+def test_normalize_full_coerces_and_caches():
+    # Non-str values are stringified before hitting the memo
+    assert normalize_full(9876543210, "phone") == "9876543210"
+    assert normalize_full(["x"], "phone") == ""
+    before = _normalize_full_cached.cache_info().hits
+    assert normalize_full("Gandhi St.") == normalize_full("Gandhi St.") == "gandhi street"
+    assert _normalize_full_cached.cache_info().hits > before
+
+
+# Precomposed (U+095C) and decomposed (U+0921 U+093C) spellings are separate keys
+@pytest.mark.parametrize(
+    "word,gender",
+    [
+        ("\u0932\u095c\u0915\u093e", "male"),
+        ("\u0932\u0921\u093c\u0915\u093e", "male"),
+        ("\u0932\u095c\u0915\u0940", "female"),
+        ("\u0932\u0921\u093c\u0915\u0940", "female"),
+    ],
+)
+def test_gender_score_hindi_nukta_forms(word, gender):
+    assert gender_score(word, gender) == 1.0